@@ -4,59 +4,163 @@ Handles parsing of Microsoft Copilot Studio localization files and extracts cont
 """
 
 import json
+import os
 import re
-from typing import Dict, List, Tuple, Optional
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, FrozenSet, Iterator, List, Pattern, Tuple, Optional
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster JSON decoding/encoding for large files
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: incremental parsing for very large files
+except ImportError:
+    ijson = None
+
 class LocalizationParser:
     """Parser for Copilot Studio localization files."""
     
+    # Files at least this large are streamed with ijson (when installed) instead of
+    # being decoded into one dict before parsing
+    STREAMING_THRESHOLD_BYTES = 50 * 1024 * 1024
+    
+    # Separator characters in raw topic names that become spaces
+    _TOPIC_TRANS = str.maketrans({'_': ' ', '-': ' '})
+    
     def __init__(self):
-        self.topic_patterns = [
-            r"topic\.([^'\.]+)",  # Extract topic name
-            r"dialog\([^.]*\.topic\.([^'\.]+)\)",  # Alternative topic pattern
-            r"globalVariable\([^.]*\.component\.([^)]+)\)",  # Global variable pattern
+        # Patterns are compiled once here; every entry in a file runs through them
+        self.topic_patterns: List[Pattern[str]] = [
+            re.compile(r"topic\.([^'\.]+)"),  # Extract topic name
+            re.compile(r"dialog\([^.]*\.topic\.([^'\.]+)\)"),  # Alternative topic pattern
+            re.compile(r"globalVariable\([^.]*\.component\.([^)]+)\)"),  # Global variable pattern
         ]
         
-        self.context_patterns = {
-            'action_type': r"action\(([^)]+)\)",
-            'trigger': r"trigger\(([^)]+)\)",
-            'component': r"\.(Card|Activity|Prompt|Entity)\.",
-            'ui_element': r"\.(text|title|DisplayName)",
-            'intent': r"Intent\.(DisplayName|TriggerQueries)"
-        }
+        # (context_type, pattern) pairs; a tuple is cheaper to walk than dict.items()
+        self.context_patterns: Tuple[Tuple[str, Pattern[str]], ...] = (
+            ('action_type', re.compile(r"action\(([^)]+)\)")),
+            ('trigger', re.compile(r"trigger\(([^)]+)\)")),
+        )
+        
+        # Fixed-literal context markers, resolved with str.find (leftmost marker wins)
+        self.context_literals: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...] = (
+            ('component', tuple((f'.{c}.', c) for c in ('Card', 'Activity', 'Prompt', 'Entity'))),
+            ('ui_element', tuple((f'.{e}', e) for e in ('text', 'title', 'DisplayName'))),
+            ('intent', tuple((f'Intent.{e}', e) for e in ('DisplayName', 'TriggerQueries'))),
+        )
+        
+        # (component, marker) in priority order for extract_ui_component
+        self._component_markers: Tuple[Tuple[str, str], ...] = tuple(
+            (c, f'.{c}.') for c in ('Card', 'Activity', 'Prompt', 'Entity', 'Intent', 'Dialog')
+        )
+        
+        # (element, suffix, indexed form) for extract_element_type
+        self._element_markers: Tuple[Tuple[str, str, str], ...] = tuple(
+            (e, f'.{e}', f'.{e}[') for e in ('text', 'title', 'DisplayName', 'TriggerQueries', 'Description')
+        )
+        self._element_set: FrozenSet[str] = frozenset(e for e, _, _ in self._element_markers)
+        
+        self._camel_re: Pattern[str] = re.compile(r'([a-z])([A-Z])')
+        
+        # Expected key shape for validate_structure
+        self._key_shape: Pattern[str] = re.compile(r"'(?:dialog|topic|globalVariable)\(")
+        
+        # Per-language exports of the same bot share their key set, so key analysis
+        # is memoized per parser instance and reused across loads
+        self._parse_key = lru_cache(maxsize=16384)(self._parse_key)
         
     def load_file(self, file_path: str) -> Dict[str, Dict]:
         """Load and parse a localization file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
+        if self._should_stream(file_path):
+            return dict(self.iter_file(file_path))
+            
+        raw_data = self._read_json(file_path)
             
-        parsed_data = {}
-        for key, value in raw_data.items():
-            parsed_entry = self.parse_entry(key, value)
-            parsed_data[key] = parsed_entry
+        return self.parse_entries(raw_data)
+        
+    def iter_file(self, file_path: str) -> Iterator[Tuple[str, Dict]]:
+        """Yield (key, parsed entry) pairs, parsing entries as they are consumed.
+        
+        Files of at least STREAMING_THRESHOLD_BYTES are streamed with ijson when it
+        is installed, so the raw file is never held in memory; smaller ones are
+        decoded whole first, which is faster.
+        """
+        if self._should_stream(file_path):
+            with open(file_path, 'rb') as f:
+                # Floats rather than ijson's default Decimal, as json/orjson decode them
+                for key, value in ijson.kvitems(f, '', use_float=True):
+                    yield key, self.parse_entry(key, value)
+            return
+            
+        for key, value in self._read_json(file_path).items():
+            yield key, self.parse_entry(key, value)
+        
+    def _should_stream(self, file_path: str) -> bool:
+        """Whether a file is large enough to parse incrementally with ijson."""
+        return ijson is not None and os.path.getsize(file_path) >= self.STREAMING_THRESHOLD_BYTES
+        
+    @staticmethod
+    def _read_json(file_path: str) -> Any:
+        """Decode a JSON file, using orjson when it is installed."""
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
             
-        return parsed_data
+    def parse_entries(self, raw_data: Dict[str, str]) -> Dict[str, Dict]:
+        """Parse a whole mapping of localization keys to values in one batch."""
+        parse_entry = self.parse_entry
+        return {key: parse_entry(key, value) for key, value in raw_data.items()}
         
     def parse_entry(self, key: str, value: str) -> Dict:
         """Parse a single localization entry."""
+        fields = self._parse_key(key)
+        description = self._build_description(
+            fields['topic'], fields['ui_component'], fields['element_type'], fields['context']
+        )
+        # Values are normally strings, but null or numeric ones must not break loading
+        if isinstance(value, str):
+            search_text = value
+        else:
+            search_text = '' if value is None else str(value)
         return {
             'text': value,
+            'topic': fields['topic'],
+            'context': dict(fields['context']),
+            'ui_component': fields['ui_component'],
+            'element_type': fields['element_type'],
+            'description': description,
+            # Lowercased search fields, computed once so searches don't re-lower every entry
+            '_lc_text': search_text.lower(),
+            '_lc_desc': description.lower(),
+            '_lc_topic': fields['topic'].lower()
+        }
+        
+    def _parse_key(self, key: str) -> Dict:
+        """Run every extractor over the key exactly once.
+        
+        The result is memoized and shared, so callers must not mutate it.
+        """
+        return {
             'topic': self.extract_topic(key),
             'context': self.extract_context(key),
             'ui_component': self.extract_ui_component(key),
-            'element_type': self.extract_element_type(key),
-            'description': self.generate_description(key)
+            'element_type': self.extract_element_type(key)
         }
         
     def extract_topic(self, key: str) -> str:
         """Extract topic name from the key."""
         for pattern in self.topic_patterns:
-            match = re.search(pattern, key)
+            match = pattern.search(key)
             if match:
                 topic = match.group(1)
                 # Clean up topic name
-                topic = topic.replace('_', ' ').replace('-', ' ')
+                topic = topic.translate(self._TOPIC_TRANS)
                 return self.format_topic_name(topic)
         
         # Handle global variables specifically
@@ -69,19 +173,34 @@ class LocalizationParser:
         """Extract context information from the key."""
         context = {}
         
-        for context_type, pattern in self.context_patterns.items():
-            match = re.search(pattern, key)
+        for context_type, pattern in self.context_patterns:
+            match = pattern.search(key)
             if match:
                 context[context_type] = match.group(1)
                 
+        for context_type, markers in self.context_literals:
+            value = self._leftmost_marker(key, markers)
+            if value:
+                context[context_type] = value
+                
         return context
         
+    @staticmethod
+    def _leftmost_marker(key: str, markers: Tuple[Tuple[str, str], ...]) -> Optional[str]:
+        """Return the name of the marker occurring earliest in the key, if any."""
+        best_pos = -1
+        best_name = None
+        for marker, name in markers:
+            pos = key.find(marker)
+            if pos != -1 and (best_pos == -1 or pos < best_pos):
+                best_pos = pos
+                best_name = name
+        return best_name
+        
     def extract_ui_component(self, key: str) -> str:
         """Extract the UI component type."""
-        components = ['Card', 'Activity', 'Prompt', 'Entity', 'Intent', 'Dialog']
-
-        for component in components:
-            if f'.{component}.' in key:
+        for component, marker in self._component_markers:
+            if marker in key:
                 return component
 
         # Handle global variables
@@ -98,17 +217,22 @@ class LocalizationParser:
 
         # Root-level DisplayName for dialog itself (e.g., ...'dialog(x).DisplayName")
         # If key ends with ".DisplayName" and has "'dialog(" earlier without another component marker
-        if key.endswith(".DisplayName") and "'dialog(" in key and '.Entity.' not in key and '.Card.' not in key and '.Activity.' not in key and '.Prompt.' not in key:
+        # (any component marker would already have returned from the loop above)
+        if key.endswith(".DisplayName") and "'dialog(" in key:
             return 'DialogDisplayName'
 
         return "Unknown"
         
     def extract_element_type(self, key: str) -> str:
         """Extract the specific element type (text, title, etc.)."""
-        elements = ['text', 'title', 'DisplayName', 'TriggerQueries', 'Description']
-        
-        for element in elements:
-            if key.endswith(f'.{element}') or f'.{element}[' in key:
+        if '[' not in key:
+            # Without indexed segments only the suffix matters, and at most one
+            # ".<element>" suffix can match, so a single set lookup decides it
+            _, dot, tail = key.rpartition('.')
+            return tail if dot and tail in self._element_set else "text"
+            
+        for element, suffix, indexed in self._element_markers:
+            if key.endswith(suffix) or indexed in key:
                 return element
                 
         return "text"
@@ -116,7 +240,7 @@ class LocalizationParser:
     def format_topic_name(self, topic: str) -> str:
         """Format topic name for better readability."""
         # Handle camelCase
-        topic = re.sub(r'([a-z])([A-Z])', r'\1 \2', topic)
+        topic = self._camel_re.sub(r'\1 \2', topic)
         
         # Capitalize words
         words = topic.split()
@@ -132,27 +256,40 @@ class LocalizationParser:
                 
         return ' '.join(formatted_words)
         
-    def generate_description(self, key: str) -> str:
-        """Generate a human-readable description of what this entry represents."""
+    def generate_description(self, key: str, topic: Optional[str] = None,
+                             component: Optional[str] = None, element: Optional[str] = None,
+                             context: Optional[Dict[str, str]] = None) -> str:
+        """Generate a human-readable description of what this entry represents.
+        
+        Callers that already extracted the key fields can pass them in to skip
+        re-parsing the key; any field left as None is extracted from the key.
+        """
+        if topic is None or component is None or element is None or context is None:
+            fields = self._parse_key(key)
+            topic = fields['topic'] if topic is None else topic
+            component = fields['ui_component'] if component is None else component
+            element = fields['element_type'] if element is None else element
+            context = fields['context'] if context is None else context
+        return self._build_description(topic, component, element, context)
+        
+    def _build_description(self, topic: str, component: str, element: str,
+                           context: Dict[str, str]) -> str:
+        """Assemble the description from already extracted key fields."""
         parts = []
         
         # Topic
-        topic = self.extract_topic(key)
         if topic != "Unknown Topic":
             parts.append(f"Topic: {topic}")
             
         # UI Component
-        component = self.extract_ui_component(key)
         if component != "Unknown":
             parts.append(f"Component: {component}")
             
         # Element type
-        element = self.extract_element_type(key)
         if element != "text":
             parts.append(f"Element: {element}")
             
         # Action context
-        context = self.extract_context(key)
         if 'action_type' in context:
             action = context['action_type']
             if action.startswith('question_'):
@@ -171,23 +308,19 @@ class LocalizationParser:
         
     def get_topic_summary(self, parsed_data: Dict[str, Dict]) -> Dict[str, int]:
         """Get a summary of topics and their entry counts."""
-        topic_counts = {}
+        return dict(self.get_topic_summary_sorted(parsed_data))
         
-        for entry in parsed_data.values():
-            topic = entry['topic']
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
-            
-        return dict(sorted(topic_counts.items()))
+    def get_topic_summary_sorted(self, parsed_data: Dict[str, Dict]) -> List[Tuple[str, int]]:
+        """Get (topic, count) pairs sorted by topic, without building a dict."""
+        return sorted(Counter(entry['topic'] for entry in parsed_data.values()).items())
         
     def get_component_summary(self, parsed_data: Dict[str, Dict]) -> Dict[str, int]:
         """Get a summary of UI components and their entry counts."""
-        component_counts = {}
+        return dict(self.get_component_summary_sorted(parsed_data))
         
-        for entry in parsed_data.values():
-            component = entry['ui_component']
-            component_counts[component] = component_counts.get(component, 0) + 1
-            
-        return dict(sorted(component_counts.items()))
+    def get_component_summary_sorted(self, parsed_data: Dict[str, Dict]) -> List[Tuple[str, int]]:
+        """Get (component, count) pairs sorted by component, without building a dict."""
+        return sorted(Counter(entry['ui_component'] for entry in parsed_data.values()).items())
         
     def filter_by_topic(self, parsed_data: Dict[str, Dict], topic: str) -> Dict[str, Dict]:
         """Filter entries by topic."""
@@ -209,9 +342,18 @@ class LocalizationParser:
         results = {}
         
         for key, entry in parsed_data.items():
-            if (search_term in entry['text'].lower() or 
-                search_term in entry['description'].lower() or
-                search_term in entry['topic'].lower()):
+            lc_text = entry.get('_lc_text')
+            if lc_text is None:
+                # Entry built outside parse_entry; lowercase on the fly
+                lc_text = entry['text'].lower()
+                lc_desc = entry['description'].lower()
+                lc_topic = entry['topic'].lower()
+            else:
+                lc_desc = entry['_lc_desc']
+                lc_topic = entry['_lc_topic']
+            if (search_term in lc_text or 
+                search_term in lc_desc or
+                search_term in lc_topic):
                 results[key] = entry
                 
         return results
@@ -219,8 +361,7 @@ class LocalizationParser:
     def validate_structure(self, file_path: str) -> Tuple[bool, List[str]]:
         """Validate the structure of a localization file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json(file_path)
                 
             errors = []
             
@@ -229,18 +370,20 @@ class LocalizationParser:
                 errors.append("File must contain a JSON object")
                 return False, errors
                 
-            # Check entries
+            # Check entries (JSON object keys are always strings, only values need a type check)
+            key_shape = self._key_shape
             for key, value in data.items():
-                if not isinstance(key, str):
-                    errors.append(f"Key must be string: {key}")
-                    
                 if not isinstance(value, str):
                     errors.append(f"Value must be string for key: {key}")
                     
                 # Check key format (basic validation)
-                if not ("'dialog(" in key or "'topic(" in key or "'globalVariable(" in key):
+                if not key_shape.search(key):
                     errors.append(f"Key doesn't match expected format: {key}")
                     
+                # Only the first 10 errors are reported; stop once that is certain
+                if len(errors) > 10:
+                    break
+                    
             if len(errors) > 10:
                 errors = errors[:10]
                 errors.append("... (showing first 10 errors)")
@@ -252,7 +395,7 @@ class LocalizationParser:
         except Exception as e:
             return False, [f"Error reading file: {str(e)}"]
             
-    def export_analysis(self, parsed_data: Dict[str, Dict], output_path: str):
+    def export_analysis(self, parsed_data: Dict[str, Dict], output_path: str) -> None:
         """Export analysis of the localization data."""
         analysis = {
             'total_entries': len(parsed_data),
@@ -261,7 +404,7 @@ class LocalizationParser:
             'entries': []
         }
         
-        for key, entry in list(parsed_data.items())[:100]:  # Limit to first 100 for readability
+        for key, entry in islice(parsed_data.items(), 100):  # Limit to first 100 for readability
             analysis['entries'].append({
                 'key': key,
                 'text': entry['text'][:100] + "..." if len(entry['text']) > 100 else entry['text'],
@@ -270,6 +413,11 @@ class LocalizationParser:
                 'description': entry['description']
             })
             
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(analysis, option=orjson.OPT_INDENT_2))
+            return
+            
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(analysis, f, ensure_ascii=False, indent=2)
 
@@ -297,20 +445,20 @@ if __name__ == "__main__":
             print(f"\nParsed {len(data)} entries")
             
             # Show topic summary
-            topics = parser.get_topic_summary(data)
+            topics = parser.get_topic_summary_sorted(data)
             print(f"\nTopics found ({len(topics)}):")
-            for topic, count in topics.items():
+            for topic, count in topics:
                 print(f"  - {topic}: {count} entries")
                 
             # Show component summary
-            components = parser.get_component_summary(data)
+            components = parser.get_component_summary_sorted(data)
             print(f"\nComponents found ({len(components)}):")
-            for component, count in components.items():
+            for component, count in components:
                 print(f"  - {component}: {count} entries")
                 
             # Show first few entries
             print(f"\nFirst 3 entries:")
-            for i, (key, entry) in enumerate(list(data.items())[:3]):
+            for i, (key, entry) in enumerate(islice(data.items(), 3)):
                 print(f"\n{i+1}. {entry['description']}")
                 print(f"   Text: {entry['text'][:100]}...")
                 print(f"   Topic: {entry['topic']}")
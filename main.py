@@ -21,7 +21,11 @@ import sys
 from typing import Dict, List, Tuple, Optional
 import threading
 import queue
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 # Import custom modules
 from localization_parser import LocalizationParser
@@ -73,14 +77,71 @@ DESIGN_TOKENS = {
     'spacing_lg': 20,
 }
 
-def get_token(theme: str, name: str):
-    base = DESIGN_TOKENS.get(theme, DESIGN_TOKENS['light'])
-    if name in DESIGN_TOKENS:  # shared scale values
-        return DESIGN_TOKENS[name]
-    return base.get(name)
+# Read-only per-theme views with the shared scale merged in, so resolving a token
+# is a single dict lookup
+THEMES = MappingProxyType({
+    theme: MappingProxyType({
+        **DESIGN_TOKENS[theme],
+        **{name: value for name, value in DESIGN_TOKENS.items() if name not in ('light', 'dark')},
+    })
+    for theme in ('light', 'dark')
+})
 
+def get_token(theme: str, name: str):
+    return THEMES.get(theme, THEMES['light']).get(name)
+
+@lru_cache(maxsize=None)
+def theme_palette(theme: str) -> dict:
+    """Everything apply_theme derives from a resolved theme's tokens.
+
+    THEMES is read-only, so each theme's palette is worked out once per session.
+    """
+    tokens = THEMES[theme]
+    bg_app = tokens['bg_app']
+    bg_card = tokens['bg_card']
+    text_primary = tokens['text_primary']
+    text_secondary = tokens['text_secondary']
+    border_color = tokens['border_subtle']
+    brand_primary = tokens['brand_primary']
+    if theme == 'light':
+        heading_bg = '#e2e8f0'
+        heading_fg = '#1e293b'
+    else:
+        heading_bg = brand_primary
+        heading_fg = tokens['text_inverse'] or '#ffffff'
+    if theme == 'dark':
+        buttons = {
+            'outline': (bg_card, '#334155', text_primary, '#1e293b', text_secondary),
+            'ghost': (bg_app, '#1e293b', text_secondary, bg_app, '#475569'),
+        }
+    else:
+        buttons = {
+            'outline': ('#ffffff', '#f1f5f9', '#1e293b', '#f1f5f9', '#94a3b8'),
+            'ghost': (bg_app, '#e2e8f0', '#475569', bg_app, '#94a3b8'),
+        }
+    return {
+        'bg_app': bg_app,
+        # (widget group, options) for the widgets registered in _theme_targets
+        'paint': (
+            ('card', {'bg': bg_card}),
+            ('app', {'bg': bg_app}),
+            ('brand', {'bg': brand_primary}),
+            ('table', {'bg': bg_card, 'highlightcolor': border_color, 'highlightbackground': border_color}),
+            ('text', {'bg': bg_card, 'fg': text_primary, 'insertbackground': text_primary}),
+            ('secondary_label', {'bg': bg_card, 'fg': text_secondary}),
+        ),
+        'treeview': {'background': bg_card, 'fieldbackground': bg_card, 'foreground': text_primary,
+                     'bordercolor': border_color, 'borderwidth': 0},
+        'heading': (heading_bg, heading_fg),
+        'buttons': buttons,
+    }
+
+@lru_cache(maxsize=1)
 def detect_system_theme():
-    """Best-effort system theme detection (Windows 10/11). Returns 'light' or 'dark'."""
+    """Best-effort system theme detection (Windows 10/11). Returns 'light' or 'dark'.
+
+    The registry is read once per session; later theme switches reuse the result.
+    """
     try:
         if sys.platform.startswith('win'):
             import winreg
@@ -93,6 +154,10 @@ def detect_system_theme():
         pass
     return 'light'
 
+# Shared Font objects and text sizes for RoundedButton (labels repeat across buttons)
+_FONT_CACHE: Dict[tuple, Font] = {}
+_MEASURE_CACHE: Dict[tuple, Tuple[int, int]] = {}
+
 # ------------------ Simple Tooltip Helper ------------------
 class Tooltip:
     """Minimal tooltip implementation for clarity of filter purposes."""
@@ -142,6 +207,15 @@ class Tooltip:
 # ------------------ Helper Classes (moved near top for availability) ------------------
 class SimpleTranslationTable:
     """Lightweight table abstraction replacing previous complex UI component."""
+    # Rows are inserted / updated through one Tcl call per chunk instead of one per row
+    BULK_CHUNK_SIZE = 500
+    _BULK_INSERT_LAMBDA = '{tree rows} {foreach {iid values} $rows {$tree insert {} end -id $iid -values $values}}'
+    # Translation results only touch the two cells that change
+    _BULK_UPDATE_LAMBDA = ('{tree rows} {foreach {iid translation status} $rows '
+                           '{$tree set $iid translation $translation; $tree set $iid status $status}}')
+    # Recent filter states whose visible rows are remembered (see apply_filters)
+    FILTER_CACHE_SIZE = 32
+
     def __init__(self, parent, edit_callback):
         self.parent = parent
         self.edit_callback = edit_callback
@@ -162,54 +236,185 @@ class SimpleTranslationTable:
         self.tree.bind('<Double-1>', self._on_edit)
         self.data = {}  # key -> record
         self.all_ids: List[str] = []  # preserve original ordering / all keys
+        self._filter_widgets = None  # (topic, component) comboboxes, see _filter_combos
+        self._applied_filter_values = None  # value lists last pushed to those comboboxes
+        self._clean_topics: Dict[str, str] = {}  # raw topic -> displayed topic (topics repeat heavily)
+        self._reset_columns()
+
+    def _reset_columns(self):
+        """Reset the per-row filter columns kept parallel to all_ids."""
+        self._index: Dict[str, int] = {}  # key -> position in all_ids
+        self._orig_lc: List[str] = []
+        self._trans: List[str] = []
+        # Lower-cased "original\x1ftranslation" per row, so search is one substring test
+        self._haystack: List[str] = []
+        self._topic: List[str] = []
+        self._comp: List[str] = []
+        self._status: List[str] = []
+        # status -> positions of the rows currently in it, so a status filter skips the rest
+        self._status_rows: Dict[str, set] = {'Pending': set(), 'Translated': set()}
+        self._visible_ids: Optional[List[str]] = None  # attached rows in order; None = all rows
+        self._topic_set = set()
+        self._comp_set = set()
+        self._topic_values = ['All Topics']
+        self._component_values = ['All Components']
+        self._filter_values_stale = False
+        # (query, topic, component, status) -> visible keys; cleared whenever rows change
+        self._filter_cache: 'OrderedDict[Tuple[str, str, str, str], List[str]]' = OrderedDict()
+        self._applied_filter_state = None  # filter state the tree currently reflects
 
     def load_data(self, data_dict):
         self.clear()
         self.data = data_dict
-        self.all_ids = []
-        for key, meta in data_dict.items():
+        self.extend_data(data_dict)
+        self.refresh_filter_values()
+
+    def extend_data(self, batch):
+        """Append rows for the entries in batch below the rows already loaded.
+
+        Used directly while a file is still being parsed; call refresh_filter_values()
+        once the last batch is in.
+        """
+        data = self.data
+        rows = []  # flat [iid, values, iid, values, ...] for the bulk insert
+        topic_set = self._topic_set
+        comp_set = self._comp_set
+        topics_add = topic_set.add
+        comps_add = comp_set.add
+        known_filter_values = len(topic_set) + len(comp_set)
+        clean_topics = self._clean_topics
+        index = self._index
+        orig_lc = self._orig_lc
+        haystack = self._haystack
+        topic_col = self._topic
+        comp_col = self._comp
+        for key, meta in batch.items():
+            if key in index:
+                continue
+            data[key] = meta
             component_val = meta.get('ui_component') or meta.get('component','')
-            raw_topic = meta.get('topic','')
-            # Clean stray trailing parenthesis if unmatched (e.g., 'Authentication)' )
-            if raw_topic.endswith(')') and raw_topic.count('(') < raw_topic.count(')'):
-                raw_topic = raw_topic.rstrip(')')
-            self.tree.insert('', 'end', iid=key, values=(meta['text'], "", raw_topic, component_val, 'Pending'))
+            topic_val = meta.get('topic','')
+            raw_topic = clean_topics.get(topic_val)
+            if raw_topic is None:
+                raw_topic = clean_topics[topic_val] = self._clean_topic(topic_val)
+            rows.append(key)
+            rows.append((meta['text'], "", raw_topic, component_val, 'Pending'))
+            index[key] = len(self.all_ids)
             self.all_ids.append(key)
-        topics = sorted({v.get('topic','') for v in data_dict.values() if v.get('topic')})
-        comps = sorted({(v.get('ui_component') or v.get('component','')) for v in data_dict.values() if (v.get('ui_component') or v.get('component'))})
-        # Build value lists with leading 'All' options
-        topic_values = ['All Topics'] + topics if topics else ['All Topics']
-        comp_values = ['All Components'] + comps if comps else ['All Components']
-        # Expose filters on root so table helper can reach them
-        root_widget = self.frame.winfo_toplevel()
-        if hasattr(root_widget, 'topic_filter'):
-            prior = root_widget.topic_filter.get()
-            root_widget.topic_filter['values'] = topic_values
-            try:
-                root_widget.topic_filter.set(prior if prior in topic_values else 'All Topics')
-            except Exception:
-                pass
-        if hasattr(root_widget, 'component_filter'):
-            prior_c = root_widget.component_filter.get()
-            root_widget.component_filter['values'] = comp_values
-            try:
-                root_widget.component_filter.set(prior_c if prior_c in comp_values else 'All Components')
-            except Exception:
-                pass
-        # Try to populate filters up the chain
-        try:
-            root = self.parent.master.master
-            root.topic_filter['values'] = topic_values
-            root.component_filter['values'] = comp_values
-        except Exception:
-            pass
+            # The parser already lower-cases entry text for search; reuse it when present
+            text_lc = meta.get('_lc_text')
+            if text_lc is None:
+                text_lc = meta['text'].lower()
+            orig_lc.append(text_lc)
+            haystack.append(text_lc + '\x1f')
+            topic_col.append(raw_topic)
+            comp_col.append(component_val)
+            if topic_val:
+                topics_add(topic_val)
+            if component_val:
+                comps_add(component_val)
+        if len(topic_set) + len(comp_set) != known_filter_values:
+            self._filter_values_stale = True
+        self._rows_changed()
+        self._bulk_apply(self._BULK_INSERT_LAMBDA, rows)
+        added = len(rows) // 2
+        self._trans.extend([''] * added)
+        self._status.extend(['Pending'] * added)
+        self._status_rows['Pending'].update(range(len(self.all_ids) - added, len(self.all_ids)))
+        if added and self._visible_ids is not None:
+            # New rows are inserted attached; copy since the list may be a cached filter result
+            self._visible_ids = self._visible_ids + self.all_ids[-added:]
+
+    @staticmethod
+    def _clean_topic(topic: str) -> str:
+        # Clean stray trailing parenthesis if unmatched (e.g., 'Authentication)' )
+        if topic.endswith(')') and topic.count('(') < topic.count(')'):
+            return topic.rstrip(')')
+        return topic
+
+    def get_filter_values(self):
+        """(topic values, component values) for the filter comboboxes, each led by its 'All' option."""
+        if self._filter_values_stale:
+            self._topic_values = ['All Topics'] + sorted(self._topic_set)
+            self._component_values = ['All Components'] + sorted(self._comp_set)
+            self._filter_values_stale = False
+        return self._topic_values, self._component_values
+
+    def refresh_filter_values(self):
+        """Offer the loaded topics and components in the filter comboboxes."""
+        topic_values, comp_values = self.get_filter_values()
+        topic_cb, comp_cb = self._filter_combos()
+        # Reopening the same bot yields the same lists; the comboboxes already hold them.
+        # This relies on nothing pushing other lists in between: a streamed load
+        # clears the rows without calling this until its last batch is in
+        if (topic_values, comp_values) == self._applied_filter_values and topic_cb is not None:
+            return
+        for combo, values, default in ((topic_cb, topic_values, 'All Topics'), (comp_cb, comp_values, 'All Components')):
+            if combo is None:
+                continue
+            # The list is set right away: the mouse wheel steps through -values without
+            # opening the dropdown. The selection only changes if it no longer exists
+            combo['values'] = values
+            if combo.get() not in values:
+                combo.set(default)
+        if topic_cb is not None:
+            self._applied_filter_values = (topic_values, comp_values)
+
+    def _filter_combos(self):
+        """The (topic, component) filter comboboxes exposed on the toplevel, resolved once."""
+        if self._filter_widgets is None:
+            owner = self.frame.winfo_toplevel()
+            widgets = (getattr(owner, 'topic_filter', None), getattr(owner, 'component_filter', None))
+            if widgets == (None, None):
+                # Filter row not built yet; look again next time
+                return widgets
+            self._filter_widgets = widgets
+        return self._filter_widgets
+
+    def _bulk_apply(self, script, rows, stride=2):
+        """Run a bulk lambda over a flat list of stride-sized records, one Tcl call per chunk."""
+        step = self.BULK_CHUNK_SIZE * stride
+        call = self.tree.tk.call
+        path = self.tree._w
+        for start in range(0, len(rows), step):
+            call('apply', script, path, tuple(rows[start:start + step]))
+
+    def _store_translation(self, key, translation) -> bool:
+        i = self._index.get(key)
+        if i is None:
+            return False
+        self._trans[i] = translation
+        self._haystack[i] = self._orig_lc[i] + '\x1f' + translation.lower()
+        status = 'Translated' if translation else 'Pending'
+        previous = self._status[i]
+        if status != previous:
+            self._status[i] = status
+            self._status_rows[previous].discard(i)
+            self._status_rows[status].add(i)
+        self._rows_changed()
+        return True
 
     def update_translation(self, key, translation):
-        if key in self.data:
-            vals = list(self.tree.item(key, 'values'))
-            vals[1] = translation
-            vals[4] = 'Translated' if translation else 'Pending'
-            self.tree.item(key, values=vals)
+        self.update_translations(((key, translation),))
+
+    def update_translations(self, results):
+        """Apply many (key, translation) results to the tree in one Tcl call per chunk."""
+        rows = []  # flat [iid, translation, status, ...]
+        status_col = self._status
+        for key, translation in results:
+            if self._store_translation(key, translation):
+                rows.append(key)
+                rows.append(translation)
+                rows.append(status_col[self._index[key]])
+        if rows:
+            self._bulk_apply(self._BULK_UPDATE_LAMBDA, rows, 3)
+
+    def row_values(self, key) -> Optional[Tuple[str, str, str, str, str]]:
+        """Current (original, translation, topic, component, status) of a row, without a Tcl call."""
+        i = self._index.get(key)
+        if i is None:
+            return None
+        return (self.data[key]['text'], self._trans[i], self._topic[i], self._comp[i], self._status[i])
 
     def get_selected_keys(self):
         return list(self.tree.selection())
@@ -230,43 +435,90 @@ class SimpleTranslationTable:
         self.tree.selection_remove(self.tree.selection())
 
     def clear_translations(self):
-        for key in self.tree.get_children():
-            vals = list(self.tree.item(key, 'values'))
-            vals[1] = ''
-            vals[4] = 'Pending'
-            self.tree.item(key, values=vals)
+        # Covers filtered-out rows too; rows still pending have nothing to clear
+        for i, key in enumerate(self.all_ids):
+            if self._status[i] != 'Pending':
+                self.update_translation(key, '')
 
     def clear(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        # Delete every known row in one call; detached (filtered out) rows are not
+        # returned by get_children() and would otherwise block re-inserting their ids
+        ids = self.all_ids or self.tree.get_children()
+        if ids:
+            self.tree.delete(*ids)
+        self.all_ids = []
+        self._reset_columns()
+
+    def _rows_changed(self):
+        """Forget filter results worked out before rows or translations changed."""
+        self._filter_cache.clear()
+        self._applied_filter_state = None
 
     def apply_filters(self, query, topic, component, status):
-        # Iterate over full id list (includes detached ones) so we can restore them
-        for key in self.all_ids:
-            if not self.tree.exists(key):
-                # Was removed somehow; skip
+        # Match against the in-memory columns; the tree is only touched for rows
+        # whose visibility actually changes
+        if status == 'All':
+            status = ''
+        state = (query, topic, component, status)
+        # Re-selecting the same combobox value or re-running the same search is a no-op
+        # until the rows themselves change
+        if state == self._applied_filter_state:
+            return
+        self._applied_filter_state = state
+        if not (query or topic or component or status):
+            # Nothing to match: every row is shown, no per-row pass needed
+            if self._visible_ids is not None:
+                self.tree.set_children('', *self.all_ids)
+                self._visible_ids = None
+            return
+        # Returning to a recent filter state (e.g. backspacing a search) reuses its result
+        cache = self._filter_cache
+        visible = cache.get(state)
+        if visible is None:
+            visible = cache[state] = self._match_rows(query, topic, component, status)
+            if len(cache) > self.FILTER_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(state)
+        current = self.all_ids if self._visible_ids is None else self._visible_ids
+        # Both lists follow all_ids order, so equal contents means an equal tree
+        if visible is not current and visible != current:
+            # One Tcl call replaces the root's child list: rows left out are detached,
+            # listed rows are (re)attached in original order. Every key in all_ids has
+            # a tree item, since rows are only deleted by clear(), which resets all_ids
+            self.tree.set_children('', *visible)
+        self._visible_ids = visible
+
+    def _match_rows(self, query, topic, component, status) -> List[str]:
+        """Keys of the rows matching every active filter, in original order."""
+        all_ids = self.all_ids
+        haystack = self._haystack
+        topic_col = self._topic
+        comp_col = self._comp
+        if status:
+            # Start from the rows already in that status rather than scanning them all
+            positions = sorted(self._status_rows.get(status, ()))
+        else:
+            positions = range(len(all_ids))
+        visible = []
+        append = visible.append
+        for i in positions:
+            if query and query not in haystack[i]:
                 continue
-            vals = self.tree.item(key, 'values')
-            show = True
-            if query and query not in vals[0].lower() and query not in (vals[1] or '').lower():
-                show = False
-            if topic and topic and vals[2] != topic:
-                show = False
-            if component and component and vals[3] != component:
-                show = False
-            if status and status != 'All' and vals[4] != status:
-                show = False
-            if show:
-                # Reattach (if already attached, this is harmless; ttk will move to end so optionally preserve ordering)
-                self.tree.reattach(key, '', 'end')
-            else:
-                self.tree.detach(key)
+            if topic and topic_col[i] != topic:
+                continue
+            if component and comp_col[i] != component:
+                continue
+            append(all_ids[i])
+        return visible
 
     def _on_edit(self, event):
         item_id = self.tree.focus()
         if not item_id:
             return
-        vals = list(self.tree.item(item_id, 'values'))
+        vals = self.row_values(item_id)
+        if vals is None:
+            return
         edit = tk.Toplevel(self.frame)
         edit.title("Edit Translation")
         tk.Label(edit, text="Original", font=("Segoe UI", 9, 'bold')).grid(row=0, column=0, sticky='w', padx=8, pady=(8,4))
@@ -300,12 +552,28 @@ class SimpleTranslationTable:
 
 class CopilotTranslator:
     """Main application class for the Copilot Localization Translator."""
+    # Delay after the last search keystroke before the table is re-filtered
+    FILTER_DEBOUNCE_MS = 120
+    # Source texts handed to the pool per worker; the rest are submitted as earlier ones finish
+    TRANSLATION_IN_FLIGHT_PER_WORKER = 2
+    # Parsed entries are handed from the loader thread to the UI in batches
+    LOAD_BATCH_SIZE = 200
+    LOAD_BATCHES_PER_TICK = 5
+    # Configures each (widget path, option list) pair; errors are ignored per widget
+    _RECOLOR_LAMBDA = '{targets} {foreach {path options} $targets {catch {$path configure {*}$options}}}'
+    # Translation progress polling backs off from the short to the long delay while idle
+    PROGRESS_POLL_MIN_MS = 25
+    PROGRESS_POLL_MAX_MS = 250
     
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Copilot Localization Translator")
         self.root.geometry("1400x900")
         self.root.minsize(1200, 700)
+        # One ttk style handle for the session (apply_theme restyles the Treeview through it)
+        self._style = ttk.Style(self.root)
+        # Decoded once; the top bar and window icon share this reference
+        self.logo_img = self._load_brand_logo()
         
         # Initialize services
         self.parser = LocalizationParser()
@@ -326,10 +594,22 @@ class CopilotTranslator:
         # UI Variables
         self.target_language = tk.StringVar(value="English")
         self.translation_style = tk.StringVar(value="formal")
-        self.progress_queue = queue.Queue()
+        # Worker -> UI messages; deque append/popleft are atomic, and only the Tk thread drains
+        self.progress_queue = deque()
         self._cancel_requested = False
+        # Shared pool for translation requests, reused across batches; sized by the
+        # service's MAX_CONCURRENT_REQUESTS setting
+        workers = self.translation_service.max_concurrent_requests
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._in_flight_limit = workers * self.TRANSLATION_IN_FLIGHT_PER_WORKER
+        self._batch_futures = []
+        self._poll_delay = self.PROGRESS_POLL_MIN_MS
+        self._filter_after_id = None
+        self._loading = False
         # Theme state ('light'|'dark'|'system')
         self.current_theme = 'system'
+        self._applied_theme = None  # resolved 'light'/'dark' the widgets are currently painted in
+        self._recolor_args: Dict[str, tuple] = {}  # resolved theme -> arguments for _RECOLOR_LAMBDA
         
         # Always build modern UI (legacy path removed)
         self.root.after(0, self._init_new_ui)
@@ -377,20 +657,18 @@ class CopilotTranslator:
             self._min_width = min_width or 0
             self._style_type = style_type  # filled | outline | ghost
             self._hovered = False
-            # temp font object for width estimation
-            try:
-                tmp = Font(font=font)
-                text_w = tmp.measure(text)
-                text_h = tmp.metrics("linespace")
-            except Exception:
-                text_w = len(text) * 8
-                text_h = 16
+            text_w, text_h = self._measure(text, font)
             width = text_w + pad_x * 2
             if self._min_width and width < self._min_width:
                 width = self._min_width
             height = text_h + pad_y * 2
             super().__init__(master, width=width, height=height, highlightthickness=0, bd=0, bg=master.cget('bg'))
             self._bg_cache = None
+            # Canvas items are created once and then only recolored (see _layout/_draw)
+            self._poly_id = None
+            self._ring_id = None
+            self._text_id = None
+            self._layout(width, height)
             self._draw(normal=True)
             self.bind('<Enter>', self._on_enter)
             self.bind('<Leave>', self._on_leave)
@@ -401,14 +679,48 @@ class CopilotTranslator:
             self.bind('<FocusIn>', lambda e: self._outline_focus(True))
             self.bind('<FocusOut>', lambda e: self._outline_focus(False))
 
+        @staticmethod
+        def _measure(text, font):
+            """(width, line height) of text in font, using the shared caches."""
+            key = (text, font)
+            size = _MEASURE_CACHE.get(key)
+            if size is None:
+                try:
+                    font_obj = _FONT_CACHE.get(font)
+                    if font_obj is None:
+                        font_obj = _FONT_CACHE[font] = Font(font=font)
+                    size = (font_obj.measure(text), font_obj.metrics("linespace"))
+                except Exception:
+                    # Rough estimate; not cached so a later call can measure properly
+                    return len(text) * 8, 16
+                _MEASURE_CACHE[key] = size
+            return size
+
         def _outline_focus(self, focused):
             # Redraw to show focus ring
             self._draw(normal=True, focused=focused)
 
+        @staticmethod
+        def _round_rect_points(x1, y1, x2, y2, r):
+            return [x1+r, y1, x2-r, y1, x2, y1, x2, y1+r, x2, y2-r, x2, y2, x2-r, y2, x1+r, y2, x1, y2, x1, y2-r, x1, y1+r, x1, y1]
+
         def _round_rect(self, x1, y1, x2, y2, r, **kwargs):
             # Draw rounded rectangle using polygons (simplified)
-            points = [x1+r, y1, x2-r, y1, x2, y1, x2, y1+r, x2, y2-r, x2, y2, x2-r, y2, x1+r, y2, x1, y2, x1, y2-r, x1, y1+r, x1, y1]
-            return self.create_polygon(points, smooth=True, **kwargs)
+            return self.create_polygon(self._round_rect_points(x1, y1, x2, y2, r), smooth=True, **kwargs)
+
+        def _layout(self, w, h):
+            """Create the button's canvas items, or move them to fit a new size."""
+            r = self._radius
+            if self._poly_id is None:
+                self._poly_id = self._round_rect(1, 1, w-2, h-2, r)
+                # focus ring, shown only while focused
+                self._ring_id = self._round_rect(1, 1, w-2, h-2, r, outline='#ffffff', width=1, state='hidden')
+                self._text_id = self.create_text(w/2, h/2, text=self._text, font=self._font)
+            else:
+                points = self._round_rect_points(1, 1, w-2, h-2, r)
+                self.coords(self._poly_id, *points)
+                self.coords(self._ring_id, *points)
+                self.coords(self._text_id, w/2, h/2)
 
         def _current_colors(self):
             normal_bg, hover_bg, fg, disabled_bg, disabled_fg = self._colors
@@ -423,22 +735,12 @@ class CopilotTranslator:
             return normal_bg, fg
 
         def _draw(self, normal=False, focused=False):
-            self.delete('all')
             bg, fg = self._current_colors()
-            w = int(self['width'])
-            h = int(self['height'])
-            r = self._radius
-            # Determine styling per type
-            if self._style_type == 'filled':
-                self._round_rect(1, 1, w-2, h-2, r, fill=bg, outline=bg)
-            elif self._style_type == 'outline':
-                self._round_rect(1, 1, w-2, h-2, r, fill=bg, outline='#cbd5e1')
-            else:  # ghost
-                self._round_rect(1, 1, w-2, h-2, r, fill=bg, outline=bg)
-            if focused and self._state != 'disabled':
-                # focus ring
-                self._round_rect(1, 1, w-2, h-2, r, outline='#ffffff', width=1)
-            self.create_text(w/2, h/2, text=self._text, fill=fg, font=self._font)
+            # Determine styling per type (filled / ghost blend the outline into the fill)
+            outline = '#cbd5e1' if self._style_type == 'outline' else bg
+            self.itemconfigure(self._poly_id, fill=bg, outline=outline)
+            self.itemconfigure(self._ring_id, state='normal' if focused and self._state != 'disabled' else 'hidden')
+            self.itemconfigure(self._text_id, text=self._text, fill=fg)
 
         def _on_enter(self, _):
             if self._state == 'disabled':
@@ -467,22 +769,19 @@ class CopilotTranslator:
                 new_text = kwargs.pop('text')
                 if new_text != self._text:
                     self._text = new_text
-                    try:
-                        tmp = Font(font=self._font)
-                        text_w = tmp.measure(self._text)
-                        text_h = tmp.metrics("linespace")
-                    except Exception:
-                        text_w = len(self._text) * 8
-                        text_h = 16
+                    text_w, text_h = self._measure(self._text, self._font)
                     new_width = text_w + self._pad_x * 2
                     if self._min_width and new_width < self._min_width:
                         new_width = self._min_width
                     new_height = text_h + self._pad_y * 2
                     # Use base class config to avoid recursion
                     tk.Canvas.config(self, width=new_width, height=new_height)
+                    self._layout(new_width, new_height)
             if kwargs:
                 # Pass any remaining supported kwargs to base class
                 super().config(**kwargs)
+                if 'width' in kwargs or 'height' in kwargs:
+                    self._layout(int(self['width']), int(self['height']))
             self._draw()
 
         # Provide attribute-like access for compatibility
@@ -529,7 +828,8 @@ class CopilotTranslator:
                     btn.config(bg=normal_bg, fg=fg)
 
     # ------------------ Global Variable Exclusion Heuristic ------------------
-    def _is_global_variable(self, key: str, meta: dict) -> bool:
+    @staticmethod
+    def _detect_global_variable(key: str, meta: dict) -> bool:
         """Determine if a localization key should be treated as a global variable.
 
         Heuristics (adjust as needed):
@@ -539,16 +839,17 @@ class CopilotTranslator:
         - Key segment contains .GlobalVariables. (future-proofing)
         """
         try:
-            if "'globalVariable(" in key:
-                return True
-            if '.GlobalVariables.' in key:
-                return True
+            # Exact comparisons first; the substring scans are O(len(key))
             topic = meta.get('topic') or ''
             if topic == 'Global Variables':
                 return True
             comp = meta.get('ui_component') or ''
             if comp == 'GlobalVariable':
                 return True
+            if "'globalVariable(" in key:
+                return True
+            if '.GlobalVariables.' in key:
+                return True
         except Exception:
             return False
         return False
@@ -594,12 +895,12 @@ class CopilotTranslator:
         brand_wrap = tk.Frame(top, bg="#ffffff")
         brand_wrap.grid(row=0, column=0, padx=12, pady=6, sticky='w')
         # Theme-aware colors
-        tp = get_token(self.current_theme, 'text_primary')
-        ts = get_token(self.current_theme, 'text_secondary')
-        card_bg = get_token(self.current_theme, 'bg_card') or '#ffffff'
+        tokens = THEMES.get(self.current_theme, THEMES['light'])
+        tp = tokens['text_primary']
+        ts = tokens['text_secondary']
+        card_bg = tokens['bg_card'] or '#ffffff'
         brand_wrap.configure(bg=card_bg)
         top.configure(bg=card_bg)
-        self.logo_img = self._load_brand_logo()
         if self.logo_img:
             tk.Label(brand_wrap, image=self.logo_img, bg=card_bg).pack(side='left', padx=(0,6))
         tk.Label(brand_wrap, text="Copilot Localization Translator", font=self.font_header, bg=card_bg, fg=tp).pack(side='left')
@@ -656,7 +957,8 @@ class CopilotTranslator:
         self.search_var = tk.StringVar()
         search_entry = tk.Entry(filter_row, textvariable=self.search_var, width=40, relief=tk.FLAT, highlightthickness=1, highlightcolor="#94a3b8")
         search_entry.grid(row=1, column=0, padx=(12,4), pady=(2,8), sticky='w')
-        search_entry.bind('<KeyRelease>', lambda e: self.apply_filters())
+        search_entry.bind('<KeyRelease>', lambda e: self._request_filter())
+        search_entry.bind('<Return>', lambda e: self._flush_filter())
 
         # Topic combobox
         self.topic_filter = ttk.Combobox(filter_row, values=['All Topics'], state='readonly', width=18)
@@ -743,6 +1045,14 @@ class CopilotTranslator:
         for txt in (self.details_original, self.details_translation):
             txt.configure(state='disabled')
 
+        # Text currently shown in each details box; a box is only rewritten when it changes
+        details_shown = {self.details_original: '', self.details_translation: ''}
+        def _show_details_text(widget, text):
+            if details_shown[widget] == text:
+                return
+            widget.configure(state='normal'); widget.replace('1.0', 'end', text); widget.configure(state='disabled')
+            details_shown[widget] = text
+
         # Selection binding to update details
         def _update_details(event=None):
             try:
@@ -753,17 +1063,27 @@ class CopilotTranslator:
                     pass
                 if not sel:
                     for t in (self.details_original, self.details_translation):
-                        t.configure(state='normal'); t.delete('1.0', 'end'); t.configure(state='disabled')
+                        _show_details_text(t, '')
                     return
                 key = sel[0]
-                item_vals = self.translation_table.tree.item(key, 'values')
-                original_text = item_vals[0]
-                translation_text = item_vals[1]
-                self.details_original.configure(state='normal'); self.details_original.delete('1.0','end'); self.details_original.insert('1.0', original_text); self.details_original.configure(state='disabled')
-                self.details_translation.configure(state='normal'); self.details_translation.delete('1.0','end'); self.details_translation.insert('1.0', translation_text); self.details_translation.configure(state='disabled')
+                item_vals = self.translation_table.row_values(key)
+                if item_vals is None:
+                    return
+                _show_details_text(self.details_original, item_vals[0])
+                _show_details_text(self.details_translation, item_vals[1])
             except Exception:
                 pass
-        self.translation_table.tree.bind('<<TreeviewSelect>>', _update_details)
+        # Drag / shift selection fires <<TreeviewSelect>> per step; coalesce those into
+        # one refresh once the event queue is idle
+        details_pending = [False]
+        def _run_update_details():
+            details_pending[0] = False
+            _update_details()
+        def _schedule_update_details(event=None):
+            if not details_pending[0]:
+                details_pending[0] = True
+                self.root.after_idle(_run_update_details)
+        self.translation_table.tree.bind('<<TreeviewSelect>>', _schedule_update_details)
         # Also update details after translations change
         self._update_details_panel = _update_details
 
@@ -777,6 +1097,16 @@ class CopilotTranslator:
         self.progress_bar = ttk.Progressbar(status, mode='determinate')
         self.progress_bar.grid(row=0, column=2, padx=12, pady=6, sticky="e")
 
+        # Widgets recolored by apply_theme, grouped by the set of options they take
+        self._theme_targets = {
+            'card': [top, filter_row, details_container],
+            'app': [table_frame],
+            'brand': [status] + ([self._frame_accent] if hasattr(self, '_frame_accent') else []),
+            'table': [self.translation_table.frame],
+            'text': [self.details_original, self.details_translation],
+            'secondary_label': [self.file_label],
+        }
+
     def clear_filters(self):
         self.search_var.set("")
         try:
@@ -787,15 +1117,33 @@ class CopilotTranslator:
             pass
         self.apply_filters()
 
+    def _request_filter(self):
+        """Coalesce a burst of search keystrokes into a single filter pass."""
+        if self._filter_after_id:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(self.FILTER_DEBOUNCE_MS, self._run_scheduled_filter)
+
+    def _run_scheduled_filter(self):
+        self._filter_after_id = None
+        self.apply_filters()
+
+    def _flush_filter(self):
+        """Apply a pending search right away (Return in the search box)."""
+        if self._filter_after_id:
+            self.root.after_cancel(self._filter_after_id)
+        self._run_scheduled_filter()
+
     def apply_filters(self):
         if not hasattr(self, 'translation_table'):
             return
         query = self.search_var.get().strip().lower()
+        # The 'All ...' entries are the comboboxes' own sentinels; compare them exactly so a
+        # real topic or component that happens to start with "All" can still be selected
         topic_v = self.topic_filter.get().strip()
-        if topic_v.lower().startswith('all'):
+        if topic_v == 'All Topics':
             topic_v = ''
         comp_v = self.component_filter.get().strip()
-        if comp_v.lower().startswith('all'):
+        if comp_v == 'All Components':
             comp_v = ''
         status_v = self.status_filter.get().strip()
         self.translation_table.apply_filters(query, topic_v, comp_v, status_v)
@@ -841,41 +1189,110 @@ class CopilotTranslator:
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         
-        if not file_path:
+        if not file_path or self._loading:
             return
             
+        self._loading = True
+        if hasattr(self, 'status_label'):
+            self.status_label.config(text="Loading file...")
+        self.load_btn.config(state="disabled")
+        self.translate_all_btn.config(state="disabled")
+        self.translate_selected_btn.config(state="disabled")
+        self.validate_btn.config(state="disabled")
+        self._refresh_button_states()
+        
+        # Rows are streamed into the emptied table while the file is parsed. The filter
+        # comboboxes keep their values and selection until _finish_load refreshes them,
+        # so a topic or component still in the new file stays selected
+        self.localization_data = {}
+        self.visible_localization_data = {}
+        self.translation_table.clear()
+        self.translation_table.data = self.visible_localization_data
+        
+        load_queue = queue.Queue()
+        thread = threading.Thread(target=self._load_file_worker, args=(file_path, load_queue))
+        thread.daemon = True
+        thread.start()
+        self.root.after(16, self._drain_load_queue, file_path, load_queue)
+        
+    def _load_file_worker(self, file_path: str, load_queue: queue.Queue):
+        """Parse a localization file in a background thread, queueing entries in batches.
+
+        The global-variable exclusion is applied here too, so each batch arrives as
+        (all entries, visible entries) and the UI thread only has to merge them.
+        """
         try:
-            if hasattr(self, 'status_label'):
-                self.status_label.config(text="Loading file...")
-                self.root.update()
-            
-            # Parse the localization file
-            self.localization_data = self.parser.load_file(file_path)
-            # Apply exclusion heuristic for global variables
-            self.visible_localization_data = {
-                k: v for k, v in self.localization_data.items() if not self._is_global_variable(k, v)
-            }
-            self.current_file = file_path
-
-            # Update UI (only show visible entries)
-            self.file_label.config(text=os.path.basename(file_path), foreground="black")
-            self.translation_table.load_data(self.visible_localization_data)
+            detect = self._detect_global_variable
+            entries = {}
+            visible = {}
+            for key, entry in self.parser.iter_file(file_path):
+                entries[key] = entry
+                if not detect(key, entry):
+                    visible[key] = entry
+                if len(entries) >= self.LOAD_BATCH_SIZE:
+                    load_queue.put(('rows', (entries, visible)))
+                    entries = {}
+                    visible = {}
+            if entries:
+                load_queue.put(('rows', (entries, visible)))
+            load_queue.put(('done', None))
+        except Exception as e:
+            load_queue.put(('error', str(e)))
             
-            # Enable controls
-            self.translate_all_btn.config(state="normal")
-            self.translate_selected_btn.config(state="normal")
-            self.validate_btn.config(state="normal")
-            self._refresh_button_states()
+    def _drain_load_queue(self, file_path: str, load_queue: queue.Queue):
+        """Move parsed batches into the table a few at a time so the UI stays responsive."""
+        try:
+            for _ in range(self.LOAD_BATCHES_PER_TICK):
+                kind, payload = load_queue.get_nowait()
+                if kind == 'rows':
+                    self._add_loaded_entries(*payload)
+                elif kind == 'done':
+                    self._finish_load(file_path)
+                    return
+                else:
+                    self._fail_load(payload)
+                    return
+        except queue.Empty:
+            pass
+        self.root.after(16, self._drain_load_queue, file_path, load_queue)
+        
+    def _add_loaded_entries(self, entries: Dict[str, Dict], visible: Dict[str, Dict]):
+        self.localization_data.update(entries)
+        self.visible_localization_data.update(visible)
+        self.translation_table.extend_data(visible)
+        if hasattr(self, 'status_label'):
+            self.status_label.config(text=f"Loading file... {len(self.visible_localization_data)} entries")
             
-            if hasattr(self, 'status_label'):
-                excluded = len(self.localization_data) - len(self.visible_localization_data)
-                excl_note = f" (excluded {excluded} global)" if excluded else ""
-                self.status_label.config(text=f"Loaded {len(self.visible_localization_data)} entries{excl_note}")
+    def _finish_load(self, file_path: str):
+        self._loading = False
+        self.current_file = file_path
+
+        # Update UI (only show visible entries)
+        self.file_label.config(text=os.path.basename(file_path), foreground="black")
+        self.translation_table.refresh_filter_values()
+        
+        # Enable controls
+        self.load_btn.config(state="normal")
+        self.translate_all_btn.config(state="normal")
+        self.translate_selected_btn.config(state="normal")
+        self.validate_btn.config(state="normal")
+        self._refresh_button_states()
+        
+        if hasattr(self, 'status_label'):
+            excluded = len(self.localization_data) - len(self.visible_localization_data)
+            excl_note = f" (excluded {excluded} global)" if excluded else ""
+            self.status_label.config(text=f"Loaded {len(self.visible_localization_data)} entries{excl_note}")
             
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load file: {str(e)}")
-            if hasattr(self, 'status_label'):
-                self.status_label.config(text="Error loading file")
+    def _fail_load(self, error: str):
+        self._loading = False
+        self.localization_data = {}
+        self.visible_localization_data = {}
+        self.translation_table.load_data(self.visible_localization_data)
+        self.load_btn.config(state="normal")
+        self._refresh_button_states()
+        messagebox.showerror("Error", f"Failed to load file: {error}")
+        if hasattr(self, 'status_label'):
+            self.status_label.config(text="Error loading file")
             
     def translate_all(self):
         """Translate all entries."""
@@ -893,10 +1310,9 @@ class CopilotTranslator:
         self.progress_bar["value"] = 0
         self.progress_bar["maximum"] = len(self.visible_localization_data)
         # Start parallel translation
-        thread = threading.Thread(target=self._translate_batch_parallel, args=(list(self.visible_localization_data.keys()),))
-        thread.daemon = True
-        thread.start()
-        self.root.after(100, self._check_translation_progress)
+        self._translate_batch_parallel(list(self.visible_localization_data.keys()))
+        self._poll_delay = self.PROGRESS_POLL_MIN_MS
+        self.root.after(self._poll_delay, self._check_translation_progress)
         
     def translate_selected(self):
         """Translate selected entries."""
@@ -915,17 +1331,18 @@ class CopilotTranslator:
         self.status_label.config(text=f"Translating {len(selected_keys)} entries...")
         self.progress_bar["value"] = 0
         self.progress_bar["maximum"] = len(selected_keys)
-        thread = threading.Thread(target=self._translate_batch_parallel, args=(selected_keys,))
-        thread.daemon = True
-        thread.start()
-        self.root.after(100, self._check_translation_progress)
+        self._translate_batch_parallel(selected_keys)
+        self._poll_delay = self.PROGRESS_POLL_MIN_MS
+        self.root.after(self._poll_delay, self._check_translation_progress)
         
     def _translate_batch(self, keys: List[str]):
         """Translate a batch of keys in background thread."""
         try:
+            language = self.target_language.get()
+            style = self.translation_style.get()
             for i, key in enumerate(keys):
                 if self._cancel_requested:
-                    self.progress_queue.put(('cancelled', None, None, None))
+                    self.progress_queue.append(('cancelled', None, None, None))
                     return
                 original_text = self.visible_localization_data[key]['text']
                 topic = self.visible_localization_data[key].get('topic')
@@ -933,91 +1350,134 @@ class CopilotTranslator:
                 # Get translation
                 translated_text = self.translation_service.translate(
                     text=original_text,
-                    target_language=self.target_language.get(),
-                    style=self.translation_style.get(),
+                    target_language=language,
+                    style=style,
                     context=topic
                 )
                 
                 # Update translated data
                 if key not in self.translated_data:
                     self.translated_data[key] = {}
-                self.translated_data[key][self.target_language.get()] = translated_text
+                self.translated_data[key][language] = translated_text
                 
                 # Report progress
-                self.progress_queue.put(('progress', i + 1, key, translated_text))
+                self.progress_queue.append(('progress', i + 1, key, translated_text))
                 
-            self.progress_queue.put(('complete', None, None, None))
+            self.progress_queue.append(('complete', None, None, None))
             
         except Exception as e:
-            self.progress_queue.put(('error', str(e), None, None))
+            self.progress_queue.append(('error', str(e), None, None))
 
     # ---------------- Parallel Translation Implementation ----------------
     def _translate_batch_parallel(self, keys: List[str]):
-        """Translate keys using a small worker pool for faster throughput."""
-        # Configuration
-        max_workers = min(5, max(1, len(keys)))  # cap concurrency
+        """Queue keys on the shared translation pool; results arrive via progress_queue."""
         self._parallel_total = len(keys)
         self._parallel_done = 0
-        self._complete_event_sent = False
-        self._cancel_event_sent = False
-        work_q = queue.Queue()
-        for k in keys:
-            work_q.put(k)
+        # Serve cache hits (repeated strings, re-runs) right away; only misses use the pool
+        language = self.target_language.get()
+        style = self.translation_style.get()
+        # Keys sharing the same source text and topic would get the same translation, so
+        # each distinct (text, topic) is requested once and the result fanned out
+        pending: Dict[Tuple[str, str], List[str]] = {}
+        for key in keys:
+            entry = self.visible_localization_data[key]
+            cached = self.translation_service.get_cached(entry['text'], language, style, entry.get('topic'))
+            if cached is None:
+                pending.setdefault((entry['text'], entry.get('topic')), []).append(key)
+                continue
+            self.translated_data.setdefault(key, {})[language] = cached
+            self._parallel_done += 1
+            self.progress_queue.append(('progress', self._parallel_done, key, cached))
+        if not pending:
+            self.progress_queue.append(('complete', None, None, None))
+            return
         lock = threading.Lock()
-
-        def worker():
-            while not self._cancel_requested:
-                try:
-                    key = work_q.get_nowait()
-                except queue.Empty:
-                    break
-                try:
-                    original_text = self.visible_localization_data[key]['text']
-                    topic = self.visible_localization_data[key].get('topic')
-                    translated_text = self.translation_service.translate(
-                        text=original_text,
-                        target_language=self.target_language.get(),
-                        style=self.translation_style.get(),
-                        context=topic
-                    )
+        failed = threading.Event()
+        next_groups = iter(pending.items())
+        outstanding = [0]  # submitted sources whose futures have not finished yet
+
+        # Workers use the language/style captured above: Tk variables are only read on the
+        # main thread, and a batch keeps its settings even if the comboboxes change mid-run
+        def translate_one(group):
+            if self._cancel_requested or failed.is_set():
+                return
+            try:
+                (original_text, topic), group_keys = group
+                translated_text = self.translation_service.translate(
+                    text=original_text,
+                    target_language=language,
+                    style=style,
+                    context=topic
+                )
+                for key in group_keys:
                     if key not in self.translated_data:
                         self.translated_data[key] = {}
-                    self.translated_data[key][self.target_language.get()] = translated_text
+                    self.translated_data[key][language] = translated_text
                     with lock:
                         self._parallel_done += 1
                         done = self._parallel_done
-                    self.progress_queue.put(('progress', done, key, translated_text))
-                except Exception as ex:
-                    self.progress_queue.put(('error', str(ex), None, None))
-                    return
-            # After loop (either finished queue or cancelled)
+                    self.progress_queue.append(('progress', done, key, translated_text))
+            except Exception as ex:
+                # Stop picking up further sources; the error ends the batch
+                failed.set()
+                self.progress_queue.append(('error', str(ex), None, None))
+
+        def submit(group):
+            future = self._executor.submit(translate_one, group)
+            self._batch_futures.append(future)
+            future.add_done_callback(on_done)
+
+        def on_done(_future):
+            # Runs once per submitted source, including ones cancelled before they started.
+            # Keeps the pool topped up until the batch runs out, fails or is cancelled
+            group = None
             with lock:
-                if self._cancel_requested and not self._cancel_event_sent:
-                    self._cancel_event_sent = True
-                    self.progress_queue.put(('cancelled', None, None, None))
-                elif (not self._cancel_requested) and self._parallel_done >= self._parallel_total and not self._complete_event_sent:
-                    self._complete_event_sent = True
-                    self.progress_queue.put(('complete', None, None, None))
-
-        threads = []
-        for _ in range(max_workers):
-            t = threading.Thread(target=worker)
-            t.daemon = True
-            t.start()
-            threads.append(t)
+                outstanding[0] -= 1
+                if not (self._cancel_requested or failed.is_set()):
+                    group = next(next_groups, None)
+                    if group is not None:
+                        outstanding[0] += 1
+                last = outstanding[0] == 0
+            if group is not None:
+                submit(group)
+                return
+            if not last or failed.is_set():
+                return
+            if self._cancel_requested:
+                self.progress_queue.append(('cancelled', None, None, None))
+            else:
+                self.progress_queue.append(('complete', None, None, None))
+
+        self._batch_futures = []
+        first_groups = []
+        with lock:
+            for group in next_groups:
+                first_groups.append(group)
+                if len(first_groups) == self._in_flight_limit:
+                    break
+            outstanding[0] = len(first_groups)
+        for group in first_groups:
+            submit(group)
             
     def _check_translation_progress(self):
         """Check translation progress from background thread."""
+        # Results drained in one pass are written to the table together (last result per
+        # key wins), and the progress bar is moved once to the latest count
+        results = {}
+        progress = None
         try:
             while True:
-                status, value, key, translation = self.progress_queue.get_nowait()
+                status, value, key, translation = self.progress_queue.popleft()
                 
                 if status == 'progress':
-                    self.progress_bar["value"] = value
-                    self.translation_table.update_translation(key, translation)
-                    self.root.update()
+                    progress = value
+                    results[key] = translation
+                    continue
                     
-                elif status == 'complete':
+                # Results queued ahead of the final message still need applying
+                self._apply_translation_results(results, progress)
+                results = {}
+                if status == 'complete':
                     self.progress_bar["value"] = self.progress_bar["maximum"]
                     if hasattr(self, 'status_label'):
                         self.status_label.config(text="Translation complete")
@@ -1053,9 +1513,21 @@ class CopilotTranslator:
                         self.translate_selected_btn.config(state='normal')
                     return
                     
-        except queue.Empty:
-            # Continue checking
-            self.root.after(100, self._check_translation_progress)
+        except IndexError:
+            self._apply_translation_results(results, progress)
+            # Continue checking: soon while results are streaming in, backing off while idle
+            if results:
+                self._poll_delay = self.PROGRESS_POLL_MIN_MS
+            else:
+                self._poll_delay = min(self._poll_delay * 2, self.PROGRESS_POLL_MAX_MS)
+            self.root.after(self._poll_delay, self._check_translation_progress)
+
+    def _apply_translation_results(self, results: Dict[str, str], progress: Optional[int]):
+        if progress is not None:
+            self.progress_bar["value"] = progress
+        if results:
+            self.translation_table.update_translations(results.items())
+            self.root.update_idletasks()
 
     def cancel_translation(self):
         """Request cancellation of the current translation batch."""
@@ -1065,6 +1537,9 @@ class CopilotTranslator:
                 self.status_label.config(text="Cancelling... (finishing current item)")
             if hasattr(self, 'cancel_translate_btn'):
                 self.cancel_translate_btn.config(state='disabled')
+            # Keys that have not started yet are dropped right away
+            for future in self._batch_futures:
+                future.cancel()
             
     def validate_translations(self):
         """Validate existing translations."""
@@ -1094,32 +1569,37 @@ class CopilotTranslator:
 
         try:
             current_lang = self.target_language.get()
-            export_data = {}
-
-            # 1. Start with all original keys preserving order
-            for key, original_entry in self.localization_data.items():
-                # If we have a translation for this key in current language, use it; else original text
-                translated_text = None
-                if key in self.translated_data:
-                    lang_map = self.translated_data[key]
-                    translated_text = lang_map.get(current_lang)
-                export_data[key] = translated_text if translated_text else original_entry['text']
-
-            # 2. Include any extra translated keys not present in original (edge case)
-            for key, lang_map in self.translated_data.items():
-                if key not in export_data:
-                    translated_text = lang_map.get(current_lang)
-                    if translated_text:  # only include if we actually have the target language value
-                        export_data[key] = translated_text
-
+            # Entries are written as they are produced (same layout as json.dump with
+            # indent=2) instead of first building a complete copy of the file in memory
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+                f.write('{')
+                separator = '\n  '
+                for key, text in self._iter_export_entries(current_lang):
+                    f.write(separator + json.dumps(key, ensure_ascii=False) + ': ' + json.dumps(text, ensure_ascii=False))
+                    separator = ',\n  '
+                f.write('}' if separator == '\n  ' else '\n}')
 
             messagebox.showinfo("Export Complete", f"File exported successfully to:\n{file_path}")
             if hasattr(self, 'status_label'):
                 self.status_label.config(text=f"Exported to {os.path.basename(file_path)}")
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export file: {str(e)}")
+
+    def _iter_export_entries(self, current_lang: str):
+        """Yield (key, text) pairs for export: every original key in order, then extras."""
+        translated_data = self.translated_data
+        # 1. All original keys, with the translation for the current language if present
+        for key, original_entry in self.localization_data.items():
+            lang_map = translated_data.get(key)
+            translated_text = lang_map.get(current_lang) if lang_map else None
+            yield key, translated_text if translated_text else original_entry['text']
+
+        # 2. Any extra translated keys not present in original (edge case)
+        for key, lang_map in translated_data.items():
+            if key not in self.localization_data:
+                translated_text = lang_map.get(current_lang)
+                if translated_text:  # only include if we actually have the target language value
+                    yield key, translated_text
             
     def select_all(self):
         """Select all entries in the table."""
@@ -1173,6 +1653,15 @@ class CopilotTranslator:
     def run(self):
         """Start the application."""
         self.root.mainloop()
+        # Don't let queued translations keep the process alive after the window closes:
+        # drop the sources not started yet (as cancel_translation does), then wait for the
+        # in-flight requests, which the client's request timeout bounds, before closing the
+        # client they use
+        self._cancel_requested = True
+        for future in self._batch_futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self.translation_service.close()
 
     # ------------------ Branding Helpers ------------------
     def _load_brand_logo(self):
@@ -1180,7 +1669,6 @@ class CopilotTranslator:
 
         To replace: place a file at assets/copilot_logo.png (64x64 or similar).
         """
-        import base64
         logo_paths = [
             os.path.join(os.path.dirname(__file__), 'assets', 'copilot_logo.png'),
             os.path.join(os.path.dirname(__file__), 'copilot_logo.png'),
@@ -1188,7 +1676,7 @@ class CopilotTranslator:
         for p in logo_paths:
             if os.path.exists(p):
                 try:
-                    return tk.PhotoImage(file=p)
+                    return tk.PhotoImage(file=p, format='png')
                 except Exception:
                     pass
         # Simple generated placeholder (indigo circle on transparent background)
@@ -1200,7 +1688,7 @@ class CopilotTranslator:
             'dwBXcAV3AFdwBXcAW+oALZtPpb+CYW3ollu85uDPAAAAABJRU5ErkJggg=='
         )
         try:
-            return tk.PhotoImage(data=placeholder_png_b64)
+            return tk.PhotoImage(data=placeholder_png_b64, format='png')
         except Exception:
             return None
 
@@ -1233,85 +1721,56 @@ class CopilotTranslator:
         else:
             resolved = theme if theme in ('light','dark') else 'light'
         self.current_theme = theme
+        # Update theme toggle button text
+        if hasattr(self, 'theme_toggle_btn'):
+            label = {'light':'🌓 Theme: Light','dark':'🌓 Theme: Dark','system':'🌓 Theme: Sys'}[self.current_theme]
+            self.theme_toggle_btn.config(text=label)
+        # Switching between 'system' and the theme it resolves to changes only the label
+        if resolved == self._applied_theme:
+            return
         theme_resolved = resolved
-        # Resolve tokens
-        bg_app = get_token(theme_resolved, 'bg_app')
-        bg_card = get_token(theme_resolved, 'bg_card')
-        text_primary = get_token(theme_resolved, 'text_primary')
-        text_secondary = get_token(theme_resolved, 'text_secondary')
-        border_color = get_token(theme_resolved, 'border_subtle')
-        brand_primary = get_token(theme_resolved, 'brand_primary')
-
+        # Colors derived from the theme's tokens (memoized per theme)
+        palette = theme_palette(theme_resolved)
+
+        # Recolor the root and registered widgets (frames, table frame, details Text
+        # widgets, file label) in a single Tcl call; a widget that rejects an option is
+        # skipped, as before. The widget set is fixed once the UI is built, so the
+        # arguments are worked out once per theme
+        recolor = self._recolor_args.get(theme_resolved)
+        if recolor is None:
+            targets = getattr(self, '_theme_targets', {})
+            recolor = [self.root._w, ('-bg', palette['bg_app'])]
+            for group, options in palette['paint']:
+                flat_options = tuple(part for name, value in options.items() for part in ('-' + name, value))
+                for widget in targets.get(group, ()):
+                    recolor.append(widget._w)
+                    recolor.append(flat_options)
+            recolor = tuple(recolor)
+            if targets:
+                self._recolor_args[theme_resolved] = recolor
         try:
-            self.root.configure(bg=bg_app)
+            self.root.tk.call('apply', self._RECOLOR_LAMBDA, recolor)
         except Exception:
             pass
-        # Recolor stored frames
-        frame_map = {
-            '_frame_topbar': bg_card,
-            '_frame_filter': bg_card,
-            '_frame_table': bg_app,
-            '_frame_details': bg_card,
-            '_frame_status': brand_primary,
-            '_frame_accent': brand_primary,
-        }
-        for name, color in frame_map.items():
-            if hasattr(self, name):
-                try:
-                    getattr(self, name).configure(bg=color)
-                except Exception:
-                    pass
-        # Table inner frame
-        if hasattr(self, 'translation_table'):
-            try:
-                self.translation_table.frame.configure(bg=bg_card, highlightcolor=border_color, highlightbackground=border_color)
-            except Exception:
-                pass
-        # Details Text widgets
-        for attr in ['details_original','details_translation']:
-            if hasattr(self, attr):
-                try:
-                    txt = getattr(self, attr)
-                    txt.configure(bg=bg_card, fg=text_primary, insertbackground=text_primary)
-                except Exception:
-                    pass
-        # File label / other labels may retain previous foreground; adjust key labels
-        if hasattr(self, 'file_label'):
-            try:
-                self.file_label.configure(bg=bg_card, fg=text_secondary)
-            except Exception:
-                pass
         # Update Treeview style (ensure header visible especially in light theme)
         try:
-            style = ttk.Style()
-            current_ttk_theme = style.theme_use()
-            style.configure('Treeview', background=bg_card, fieldbackground=bg_card, foreground=text_primary, bordercolor=border_color, borderwidth=0)
-            if theme_resolved == 'light':
-                heading_bg = '#e2e8f0'
-                heading_fg = '#1e293b'
-            else:
-                heading_bg = brand_primary
-                heading_fg = get_token(theme_resolved, 'text_inverse') or '#ffffff'
+            style = self._style
+            style.configure('Treeview', **palette['treeview'])
+            heading_bg, heading_fg = palette['heading']
             style.configure('Treeview.Heading', background=heading_bg, foreground=heading_fg, relief='flat', font=('Segoe UI Semibold', 9))
             style.map('Treeview.Heading', background=[('active', heading_bg), ('pressed', heading_bg)], foreground=[('active', heading_fg)])
         except Exception:
             pass
-        # Update button palette adaptation (simple approach: rebuild palettes for dark)
-        if theme_resolved == 'dark':
-            self._button_palette['outline'] = (bg_card, '#334155', text_primary, '#1e293b', text_secondary)
-            self._button_palette['ghost'] = (bg_app, '#1e293b', text_secondary, bg_app, '#475569')
-        else:
-            self._button_palette['outline'] = ('#ffffff', '#f1f5f9', '#1e293b', '#f1f5f9', '#94a3b8')
-            self._button_palette['ghost'] = (bg_app, '#e2e8f0', '#475569', bg_app, '#94a3b8')
-        # Update theme toggle button text
-        if hasattr(self, 'theme_toggle_btn'):
-            label = {'light':'🌓 Theme: Light','dark':'🌓 Theme: Dark','system':'🌓 Theme: Sys'}[self.current_theme]
-            self.theme_toggle_btn.config(text=label)
-        # Refresh all buttons to adopt new palette colors
-        try:
-            self._refresh_button_states()
-        except Exception:
-            pass
+        # Update button palette adaptation (outline / ghost variants follow the theme)
+        button_colors = palette['buttons']
+        if any(self._button_palette.get(variant) != colors for variant, colors in button_colors.items()):
+            self._button_palette.update(button_colors)
+            # Refresh all buttons to adopt new palette colors
+            try:
+                self._refresh_button_states()
+            except Exception:
+                pass
+        self._applied_theme = theme_resolved
 
     def toggle_theme(self):
         order = ['system','light','dark']
@@ -4,20 +4,53 @@ Handles AI-powered translations using OpenAI's API with context-aware prompts.
 """
 
 import os
+import re
+import sys
 import json
+import atexit
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
-from openai import AzureOpenAI
-from dotenv import load_dotenv
 import time
+import random
 import hashlib
+from functools import lru_cache
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson  # Optional: faster translation cache reads and writes
+except ImportError:
+    orjson = None
+
+# Placeholders such as {name} that a translation must carry over unchanged
+_PLACEHOLDER_RE = re.compile(r'\{[^}]+\}')
+
+# The digest only names cache entries; on 3.9+ say so, which also keeps MD5 usable on
+# FIPS-restricted OpenSSL builds
+_MD5_OPTIONS = {'usedforsecurity': False} if sys.version_info >= (3, 9) else {}
+
+@lru_cache(maxsize=8192)
+def _hash_cache_key(text: str, target_language: str, style: str, context: str) -> str:
+    # The on-disk cache is keyed by these MD5 digests; memoizing them means the cache
+    # pre-check and the translate call that follows hash each string once
+    content = f"{text}|{target_language}|{style}|{context}"
+    return hashlib.md5(content.encode('utf-8'), **_MD5_OPTIONS).hexdigest()
 
 class TranslationService:
     """AI-powered translation service for localization content."""
     
+    # Prefix _mock_translate gives each style's output
+    _MOCK_PREFIX = {
+        'formal': '[FORMAL]',
+        'conversational': '[CONV]',
+        'chatbot': '[BOT]'
+    }
+    
     def __init__(self):
+        # Load environment variables when a service is created, not when the module is imported
+        from dotenv import load_dotenv
+        load_dotenv()
+        
         self.client = None
         self.api_key = os.getenv('AZURE_OPENAI_API_KEY')
         self.azure_endpoint = os.getenv('AZURE_OPENAI_ENDPOINT')
@@ -25,24 +58,48 @@ class TranslationService:
         self.deployment_name = os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME', 'gpt-4')
         self.max_tokens = int(os.getenv('MAX_TOKENS', '2000'))
         self.temperature = float(os.getenv('TEMPERATURE', '0.3'))
+        # Requests callers may run at once (requests are network-bound; bounded by API rate limits)
+        self.max_concurrent_requests = max(1, int(os.getenv('MAX_CONCURRENT_REQUESTS', '5')))
+        # Seconds a single API request may take; translate() retries on its own, within
+        # its overall deadline, so the client itself does not retry
+        self.request_timeout = max(1.0, float(os.getenv('REQUEST_TIMEOUT', '30')))
         
-        # Translation cache to avoid duplicate API calls
-        self.translation_cache = {}
+        # Translation cache to avoid duplicate API calls, least recently used first; past
+        # max_cache_entries the oldest entries are dropped (from the file too, on the next save)
+        self.translation_cache: Dict[str, str] = OrderedDict()
+        self.max_cache_entries = max(1, int(os.getenv('TRANSLATION_CACHE_MAX_ENTRIES', '50000')))
         self.cache_file = "translation_cache.json"
+        # New entries are appended here in batches (one JSON [key, value] per line) and
+        # folded back into cache_file by flush_cache, so a save never rewrites the cache
+        self.cache_journal_file = "translation_cache.jsonl"
+        self.cache_save_interval = 50
+        self._unjournaled_entries: List[Tuple[str, str]] = []
+        self._journal_entries = 0  # journal lines not yet folded into cache_file
+        # Serializes cache writes; translations may finish on several threads at once
+        self._cache_lock = threading.Lock()
         self.load_cache()
+        atexit.register(self.flush_cache)
         
         # Initialize Azure OpenAI client if credentials are available
         if (self.api_key and self.api_key != 'your_azure_openai_api_key_here' and
             self.azure_endpoint and self.azure_endpoint != 'your_azure_openai_endpoint_here'):
             try:
+                # openai pulls in pydantic and httpx; only pay for that import when
+                # there are credentials to use it with
+                from openai import AzureOpenAI
                 self.client = AzureOpenAI(
                     api_key=self.api_key,
                     api_version=self.api_version,
-                    azure_endpoint=self.azure_endpoint
+                    azure_endpoint=self.azure_endpoint,
+                    timeout=self.request_timeout,
+                    max_retries=0
                 )
             except Exception as e:
                 print(f"Warning: Failed to initialize Azure OpenAI client: {e}")
                 
+        # (target_language, style) -> prompt text around the context line
+        self._prompt_parts: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        
         # Style templates for different translation approaches
         self.style_templates = {
             'formal': {
@@ -59,31 +116,125 @@ class TranslationService:
             }
         }
         
+    def close(self):
+        """Write pending cache entries and release the API client's pooled HTTP connections."""
+        self.flush_cache()
+        if self.client is not None:
+            try:
+                self.client.close()
+            except Exception as e:
+                print(f"Warning: Failed to close Azure OpenAI client: {e}")
+                
     def load_cache(self):
         """Load translation cache from file."""
         try:
             if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    self.translation_cache = json.load(f)
+                if orjson is not None:
+                    with open(self.cache_file, 'rb') as f:
+                        self.translation_cache = OrderedDict(orjson.loads(f.read()))
+                else:
+                    with open(self.cache_file, 'r', encoding='utf-8') as f:
+                        self.translation_cache = OrderedDict(json.load(f))
         except Exception as e:
             print(f"Warning: Failed to load translation cache: {e}")
-            self.translation_cache = {}
+            self.translation_cache = OrderedDict()
+        # Replay entries journaled since the last full save (e.g. before a crash)
+        try:
+            if os.path.exists(self.cache_journal_file):
+                with open(self.cache_journal_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            key, value = json.loads(line)
+                        except ValueError:
+                            continue  # line cut short by an interrupted write
+                        self.translation_cache[key] = value
+                        self.translation_cache.move_to_end(key)
+                        self._journal_entries += 1
+        except Exception as e:
+            print(f"Warning: Failed to load translation cache journal: {e}")
+        self._evict_cache_overflow()
             
     def save_cache(self):
-        """Save translation cache to file."""
+        """Save translation cache to file.
+
+        The cache is written to a temporary file that then replaces the real one, so a
+        crash or a concurrent reader never sees a half-written cache.
+        """
+        tmp_file = self.cache_file + '.tmp'
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.translation_cache, f, ensure_ascii=False, indent=2)
+            with self._cache_lock:
+                # Copy first: other threads may add entries while this one serializes
+                snapshot = dict(self.translation_cache)
+                if orjson is not None:
+                    with open(tmp_file, 'wb') as f:
+                        f.write(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(tmp_file, 'w', encoding='utf-8') as f:
+                        json.dump(snapshot, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_file, self.cache_file)
+                # Everything journaled is now in cache_file
+                self._unjournaled_entries = []
+                if self._journal_entries and os.path.exists(self.cache_journal_file):
+                    os.remove(self.cache_journal_file)
+                self._journal_entries = 0
         except Exception as e:
             print(f"Warning: Failed to save translation cache: {e}")
             
+    def flush_cache(self):
+        """Fold new and journaled entries into the cache file, if there are any."""
+        if self._unjournaled_entries or self._journal_entries:
+            self.save_cache()
+            
+    def _append_cache_journal(self):
+        """Append entries added since the last write to the journal file."""
+        try:
+            with self._cache_lock:
+                entries = self._unjournaled_entries
+                if not entries:
+                    return
+                lines = ''.join(json.dumps([key, value], ensure_ascii=False) + '\n' for key, value in entries)
+                with open(self.cache_journal_file, 'a', encoding='utf-8') as f:
+                    f.write(lines)
+                self._journal_entries += len(entries)
+                self._unjournaled_entries = []
+        except Exception as e:
+            print(f"Warning: Failed to append to translation cache journal: {e}")
+            
+    def _evict_cache_overflow(self):
+        """Drop least recently used entries beyond max_cache_entries."""
+        while len(self.translation_cache) > self.max_cache_entries:
+            self.translation_cache.popitem(last=False)
+            
+    def _lookup_cache(self, cache_key: str) -> Optional[str]:
+        """Return the cached translation for a key, marking it as recently used."""
+        with self._cache_lock:
+            translated_text = self.translation_cache.get(cache_key)
+            if translated_text is not None:
+                self.translation_cache.move_to_end(cache_key)
+        return translated_text
+        
+    def _cache_translation(self, cache_key: str, translated_text: str):
+        """Store a new translation, journaling it once enough entries have accumulated."""
+        with self._cache_lock:
+            self.translation_cache[cache_key] = translated_text
+            self.translation_cache.move_to_end(cache_key)
+            self._evict_cache_overflow()
+            self._unjournaled_entries.append((cache_key, translated_text))
+            write_due = len(self._unjournaled_entries) >= self.cache_save_interval
+        if write_due:
+            self._append_cache_journal()
+            
     def get_cache_key(self, text: str, target_language: str, style: str, context: str) -> str:
         """Generate a cache key for the translation."""
-        content = f"{text}|{target_language}|{style}|{context}"
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        return _hash_cache_key(text, target_language, style, context)
+        
+    def get_cached(self, text: str, target_language: str, style: str, context: str) -> Optional[str]:
+        """Return the cached translation for these arguments, or None without calling the API."""
+        target_language, style = sys.intern(target_language), sys.intern(style)
+        return self._lookup_cache(self.get_cache_key(text, target_language, style, context))
         
     def translate(self, text: str, target_language: str, style: str = 'formal', 
-                 context: str = '', max_retries: int = 3) -> str:
+                 context: str = '', max_retries: int = 3, max_total_seconds: float = 60.0) -> str:
         """
         Translate text with context awareness.
         
@@ -93,14 +244,20 @@ class TranslationService:
             style: Translation style (formal, conversational, chatbot)
             context: Context information (topic, component type, etc.)
             max_retries: Maximum number of retry attempts
+            max_total_seconds: Give up instead of waiting past this many seconds overall
             
         Returns:
             Translated text
         """
+        # Language and style come from a small fixed vocabulary; interned, the memoized
+        # key and prompt lookups compare them by identity instead of character by character
+        target_language, style = sys.intern(target_language), sys.intern(style)
+        
         # Check cache first
         cache_key = self.get_cache_key(text, target_language, style, context)
-        if cache_key in self.translation_cache:
-            return self.translation_cache[cache_key]
+        cached = self._lookup_cache(cache_key)
+        if cached is not None:
+            return cached
             
         # If no Azure OpenAI client, return mock translation
         if not self.client:
@@ -110,6 +267,7 @@ class TranslationService:
         prompt = self._build_translation_prompt(text, target_language, style, context)
         
         # Attempt translation with retries
+        deadline = time.monotonic() + max_total_seconds
         for attempt in range(max_retries):
             try:
                 response = self.client.chat.completions.create(
@@ -119,7 +277,9 @@ class TranslationService:
                         {"role": "user", "content": prompt}
                     ],
                     max_completion_tokens=self.max_tokens,
-                    temperature=1
+                    temperature=1,
+                    # A request never runs past the overall deadline either
+                    timeout=max(1.0, min(self.request_timeout, deadline - time.monotonic()))
                 )
                 
                 translated_text = response.choices[0].message.content.strip()
@@ -130,37 +290,61 @@ class TranslationService:
                     translated_text = translated_text[1:-1]
                     
                 # Cache the result
-                self.translation_cache[cache_key] = translated_text
-                self.save_cache()
+                self._cache_translation(cache_key, translated_text)
                 
                 return translated_text
                 
             except Exception as e:
-                if attempt == max_retries - 1:
-                    # Final attempt failed, return error message
+                # Exponential backoff with jitter, so parallel workers hitting the same
+                # rate limit don't all retry at the same moment
+                delay = min(2 ** attempt, 30) * (0.5 + random.random())
+                if (attempt == max_retries - 1 or not self._is_retryable(e)
+                        or time.monotonic() + delay > deadline):
+                    # Final attempt failed (or retrying can't help), return error message
                     error_msg = f"Translation failed: {str(e)}"
                     print(error_msg)
                     return f"[ERROR: {error_msg}]"
                 else:
                     # Wait before retry
-                    time.sleep(2 ** attempt)
+                    time.sleep(delay)
                     
         return "[ERROR: Translation failed after retries]"
         
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """False for API errors that will fail the same way again (bad request, auth, not found)."""
+        status_code = getattr(error, 'status_code', None)
+        if status_code is None:
+            return True  # connection problems, timeouts
+        return status_code in (408, 409, 429) or status_code >= 500
+        
     def _build_translation_prompt(self, text: str, target_language: str, 
                                 style: str, context: str) -> str:
         """Build a context-aware translation prompt."""
+        # Everything except the context line and the text depends only on language and
+        # style, so those parts are built once per combination
+        parts = self._prompt_parts.get((target_language, style))
+        if parts is None:
+            parts = self._prompt_parts[(target_language, style)] = self._build_prompt_parts(target_language, style)
+        head, body = parts
+        
+        if context:
+            head += f"Specific context: {context}\n"
+            
+        return f"""{head}{body}"{text}"
+
+Provide only the translated text without any explanations or additional content."""
+        
+    def _build_prompt_parts(self, target_language: str, style: str) -> Tuple[str, str]:
+        """The prompt text before and after the optional context line, up to the text itself."""
         style_info = self.style_templates.get(style, self.style_templates['formal'])
         
-        prompt = f"""Translate the following text to {target_language}.
+        head = f"""Translate the following text to {target_language}.
 
 Context: This text is from a Microsoft Copilot Studio chatbot interface.
 """
         
-        if context:
-            prompt += f"Specific context: {context}\n"
-            
-        prompt += f"""
+        body = f"""
 Translation style: {style_info['description']}
 {style_info['prompt_addition']}
 
@@ -173,11 +357,9 @@ Important guidelines:
 6. For chatbot responses, maintain the conversational flow and tone
 
 Text to translate:
-"{text}"
-
-Provide only the translated text without any explanations or additional content."""
+"""
 
-        return prompt
+        return head, body
         
     def _mock_translate(self, text: str, target_language: str, style: str) -> str:
         """
@@ -185,11 +367,7 @@ Provide only the translated text without any explanations or additional content.
         This is useful for development and testing.
         """
         # Simple mock translation by adding a prefix
-        style_prefix = {
-            'formal': '[FORMAL]',
-            'conversational': '[CONV]',
-            'chatbot': '[BOT]'
-        }.get(style, '[TRANS]')
+        style_prefix = self._MOCK_PREFIX.get(style, '[TRANS]')
         
         return f"{style_prefix} {text} [{target_language.upper()}]"
         
@@ -199,6 +377,11 @@ Provide only the translated text without any explanations or additional content.
         """
         Translate multiple texts in batch.
         
+        Cache hits are filled in (and reported) up front; each remaining distinct
+        text/context is requested once, concurrently (up to max_concurrent_requests).
+        Results keep the order of texts, and progress_callback is invoked from the
+        calling thread as each one finishes.
+        
         Args:
             texts: List of texts to translate
             target_language: Target language
@@ -211,17 +394,43 @@ Provide only the translated text without any explanations or additional content.
         """
         if contexts is None:
             contexts = [''] * len(texts)
+        target_language, style = sys.intern(target_language), sys.intern(style)
             
-        results = []
+        pairs = list(zip(texts, contexts))
+        results = [None] * len(pairs)
         total = len(texts)
+        done = 0
         
-        for i, (text, context) in enumerate(zip(texts, contexts)):
-            translated = self.translate(text, target_language, style, context)
-            results.append(translated)
-            
-            if progress_callback:
-                progress_callback(i + 1, total, text, translated)
+        # One pass over the inputs: cached texts are answered here, misses are grouped
+        # by cache key so duplicates share a single request
+        pending: Dict[str, List[int]] = {}
+        for i, (text, context) in enumerate(pairs):
+            cache_key = self.get_cache_key(text, target_language, style, context)
+            cached = self._lookup_cache(cache_key)
+            if cached is not None:
+                results[i] = cached
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total, text, results[i])
+            else:
+                pending.setdefault(cache_key, []).append(i)
+                
+        if pending:
+            workers = min(self.max_concurrent_requests, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for indices in pending.values():
+                    text, context = pairs[indices[0]]
+                    futures[executor.submit(self.translate, text, target_language, style, context)] = indices
+                for future in as_completed(futures):
+                    translated = future.result()
+                    for i in futures[future]:
+                        results[i] = translated
+                        done += 1
+                        if progress_callback:
+                            progress_callback(done, total, pairs[i][0], translated)
                 
+        self.flush_cache()
         return results
         
     def validate_translation(self, original: str, translated: str, 
@@ -245,7 +454,7 @@ Provide only the translated text without any explanations or additional content.
         }
         
         # Check for empty translation
-        if not translated or translated.strip() == '':
+        if not translated or not translated.strip():
             validation_result['errors'].append("Translation is empty")
             validation_result['is_valid'] = False
             validation_result['score'] = 0.0
@@ -269,15 +478,19 @@ Provide only the translated text without any explanations or additional content.
             validation_result['score'] -= 0.2
             
         # Check length ratio (translations shouldn't be extremely different in length)
-        length_ratio = len(translated) / len(original) if len(original) > 0 else 1
+        original_len = len(original)
+        translated_len = len(translated)
+        length_ratio = translated_len / original_len if original_len > 0 else 1
         if length_ratio > 3 or length_ratio < 0.3:
             validation_result['warnings'].append(
                 f"Unusual length ratio: {length_ratio:.2f}"
             )
             validation_result['score'] -= 0.1
             
-        # Check for common issues
-        if original.lower() == translated.lower():
+        # Check for common issues. Lower-casing keeps the length of ASCII text, so two
+        # ASCII strings of different lengths can't match and are not copied to compare
+        if ((original_len == translated_len or not (original.isascii() and translated.isascii()))
+                and original.lower() == translated.lower()):
             validation_result['warnings'].append("Translation appears unchanged")
             validation_result['score'] -= 0.3
             
@@ -288,8 +501,7 @@ Provide only the translated text without any explanations or additional content.
         
     def _extract_placeholders(self, text: str) -> List[str]:
         """Extract placeholders like {variable} from text."""
-        import re
-        return re.findall(r'\{[^}]+\}', text)
+        return _PLACEHOLDER_RE.findall(text)
         
     def get_supported_languages(self) -> List[str]:
         """Get list of supported languages."""
@@ -6,8 +6,27 @@ Modern UI components for the Copilot Localization Translator application.
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, font
 from typing import Dict, List, Callable, Optional, Any
+from functools import lru_cache
 import threading
 
+# Font objects shared by the canvas-drawn widgets, keyed by font spec
+_FONT_CACHE: Dict[tuple, font.Font] = {}
+
+def _shared_font(spec) -> font.Font:
+    """Return the shared Font object for a font tuple such as ("Segoe UI", 11)."""
+    if isinstance(spec, font.Font):
+        return spec
+    shared = _FONT_CACHE.get(spec)
+    if shared is None:
+        shared = _FONT_CACHE[spec] = font.Font(font=spec)
+    return shared
+
+@lru_cache(maxsize=8192)
+def _truncated(text: str, max_length: int) -> str:
+    # Memoized because a row's texts are truncated again every time the row is redrawn,
+    # and localization files repeat many of their longer strings
+    return text[:max_length-3] + "..."
+
 class ModernStyle:
     """Advanced modern UI styling constants inspired by contemporary design."""
     
@@ -63,6 +82,15 @@ class ModernStyle:
     BUTTON_FONT = ("Segoe UI", 11, "bold")
     SMALL_FONT = ("Segoe UI", 10)
     CAPTION_FONT = ("Segoe UI", 9)
+    # The tuples above; init_fonts replaces the attributes with Font objects built from these
+    _FONT_SPECS = (
+        ("HEADER_FONT", HEADER_FONT),
+        ("SUBHEADER_FONT", SUBHEADER_FONT),
+        ("BODY_FONT", BODY_FONT),
+        ("BUTTON_FONT", BUTTON_FONT),
+        ("SMALL_FONT", SMALL_FONT),
+        ("CAPTION_FONT", CAPTION_FONT),
+    )
     
     # Spacing & Dimensions (modern standards)
     CARD_RADIUS = 12              # Border radius for cards
@@ -71,144 +99,174 @@ class ModernStyle:
     SECTION_SPACING = 24          # Space between sections
     ITEM_SPACING = 16             # Space between items
     
+    # Tcl interpreter the styles below were last applied to
+    _configured_interp = None
+    
+    @staticmethod
+    def init_fonts(root=None):
+        """Turn the font constants into Font objects shared by every widget using them.
+
+        Tk then resolves each font once, rather than parsing the font tuple again for
+        every widget it is passed to. Fonts belong to an interpreter, so this runs once
+        per interpreter (from configure_style).
+        """
+        _FONT_CACHE.clear()
+        for name, spec in ModernStyle._FONT_SPECS:
+            shared = _FONT_CACHE[spec] = font.Font(root, font=spec)
+            setattr(ModernStyle, name, shared)
+    
     @staticmethod
     def configure_style():
-        """Configure modern UI styles with enhanced visual effects."""
+        """Configure modern UI styles with enhanced visual effects.
+
+        Fonts and styles belong to the Tk interpreter, so the work is done once per
+        interpreter; later calls (one per TranslationTable) return straight away.
+        """
         style = ttk.Style()
+        if ModernStyle._configured_interp is style.tk:
+            return
         
         # Use a modern theme as base
         style.theme_use('clam')
         
         # Configure default font for all tkinter widgets
-        import tkinter as tk
-        tk.font.nametofont("TkDefaultFont").configure(family="Segoe UI", size=11)
-        tk.font.nametofont("TkTextFont").configure(family="Segoe UI", size=11)
-        tk.font.nametofont("TkFixedFont").configure(family="Consolas", size=11)
-        tk.font.nametofont("TkMenuFont").configure(family="Segoe UI", size=10)
-        tk.font.nametofont("TkHeadingFont").configure(family="Segoe UI", size=14, weight="bold")
-        tk.font.nametofont("TkCaptionFont").configure(family="Segoe UI", size=9)
-        tk.font.nametofont("TkSmallCaptionFont").configure(family="Segoe UI", size=8)
-        tk.font.nametofont("TkIconFont").configure(family="Segoe UI", size=11)
-        tk.font.nametofont("TkTooltipFont").configure(family="Segoe UI", size=10)
-        
-        # Configure default ttk styles with modern fonts
-        style.configure(".", font=ModernStyle.BODY_FONT)
-        style.configure("TLabel", font=ModernStyle.BODY_FONT, background=ModernStyle.BG_CARD)
-        style.configure("TFrame", background=ModernStyle.BG_CARD)
-        style.configure("TEntry", font=ModernStyle.BODY_FONT, fieldbackground=ModernStyle.BG_CARD)
-        style.configure("TCombobox", font=ModernStyle.BODY_FONT)
-        style.configure("Treeview", font=ModernStyle.BODY_FONT, background=ModernStyle.BG_CARD)
-        style.configure("Treeview.Heading", font=ModernStyle.SUBHEADER_FONT)
-        
-        # Modern Primary Button
-        style.configure("ModernPrimary.TButton",
-                       background=ModernStyle.PRIMARY_BLUE,
-                       foreground=ModernStyle.TEXT_WHITE,
-                       font=ModernStyle.BUTTON_FONT,
-                       padding=(20, 12),
-                       relief="flat",
-                       borderwidth=0)
-        
-        # Modern frame styles
-        style.configure("Modern.TFrame",
-                       background=ModernStyle.BG_CARD,
-                       relief="flat",
-                       borderwidth=0)
-        
-        style.configure("Card.TFrame",
-                       background=ModernStyle.BG_CARD,
-                       relief="flat", 
-                       borderwidth=0)
-        
-        # Modern combobox
-        style.configure("Modern.TCombobox",
-                       font=ModernStyle.BODY_FONT,
-                       fieldbackground=ModernStyle.BG_SECONDARY)
+        for name, options in _NAMED_FONTS:
+            font.nametofont(name).configure(**options)
+        ModernStyle.init_fonts(style.master)
+        
+        # Default ttk style overrides, then the named modern styles
+        for name, options in _STYLE_CONFIGS:
+            style.configure(name, **options)
+        
+        ModernStyle._configured_interp = style.tk
+
+# Tk named fonts and the family/size configure_style gives each
+_NAMED_FONTS = (
+    ("TkDefaultFont", {"family": "Segoe UI", "size": 11}),
+    ("TkTextFont", {"family": "Segoe UI", "size": 11}),
+    ("TkFixedFont", {"family": "Consolas", "size": 11}),
+    ("TkMenuFont", {"family": "Segoe UI", "size": 10}),
+    ("TkHeadingFont", {"family": "Segoe UI", "size": 14, "weight": "bold"}),
+    ("TkCaptionFont", {"family": "Segoe UI", "size": 9}),
+    ("TkSmallCaptionFont", {"family": "Segoe UI", "size": 8}),
+    ("TkIconFont", {"family": "Segoe UI", "size": 11}),
+    ("TkTooltipFont", {"family": "Segoe UI", "size": 10}),
+)
+
+# (style name, options) applied by configure_style, built once at import
+_STYLE_CONFIGS = (
+    # Default ttk styles, only where they differ from clam: its body font is
+    # TkDefaultFont (set to BODY_FONT above) and entry fields and tree rows are white
+    ("TLabel", {"background": ModernStyle.BG_CARD}),
+    ("TFrame", {"background": ModernStyle.BG_CARD}),
+    ("Treeview.Heading", {"font": ModernStyle.SUBHEADER_FONT}),
+    # Modern primary button
+    ("ModernPrimary.TButton", {"background": ModernStyle.PRIMARY_BLUE, "foreground": ModernStyle.TEXT_WHITE,
+                               "font": ModernStyle.BUTTON_FONT, "padding": (20, 12), "relief": "flat", "borderwidth": 0}),
+    # Modern frame styles
+    ("Modern.TFrame", {"background": ModernStyle.BG_CARD, "relief": "flat", "borderwidth": 0}),
+    ("Card.TFrame", {"background": ModernStyle.BG_CARD, "relief": "flat", "borderwidth": 0}),
+    # Modern combobox
+    ("Modern.TCombobox", {"font": ModernStyle.BODY_FONT, "fieldbackground": ModernStyle.BG_SECONDARY}),
+)
+
+# Translation table columns: (column, heading, heading anchor, width, minwidth, stretch)
+_TABLE_COLUMNS = (
+    ('original', '📝 Original Text', tk.W, 350, 200, True),
+    ('translation', '🌐 Translation', tk.W, 350, 200, True),
+    ('topic', '📁 Topic', tk.W, 180, 100, True),
+    ('component', '🧩 Component', tk.W, 120, 80, True),
+    ('status', '📊 Status', tk.CENTER, 100, 80, False),
+)
+
+# Treeview row tags and their colors, configured once per table; rows only name a tag
+_ROW_TAGS = (
+    ('translated', {"background": ModernStyle.STATUS_SUCCESS, "foreground": ModernStyle.ACCENT_GREEN}),
+    ('pending', {"background": ModernStyle.STATUS_WARNING, "foreground": ModernStyle.ACCENT_ORANGE}),
+    ('selected', {"background": ModernStyle.STATUS_INFO, "foreground": ModernStyle.PRIMARY_BLUE}),
+)
 
 class ModernCard:
     """Modern card widget with rounded corners and shadow effect."""
     
     @staticmethod
     def create_card(parent, bg_color=None, shadow=True, padding=None):
-        """Create a modern card with shadow effect."""
+        """Create a modern card with shadow effect.
+
+        The card is a single frame: its internal padding replaces the padded content
+        frame and a highlight border stands in for the simulated shadow. Place the
+        returned frame with pack/grid and put the content directly inside it.
+        """
         if bg_color is None:
             bg_color = ModernStyle.BG_CARD
         if padding is None:
             padding = ModernStyle.CARD_PADDING
             
-        # Create container for card and shadow
-        container = tk.Frame(parent, bg=ModernStyle.BG_GRADIENT_START)
-        
-        # Shadow container (simulates drop shadow)
-        if shadow:
-            shadow_frame = tk.Frame(container, bg=ModernStyle.SHADOW_LIGHT, height=2)
-            shadow_frame.pack(fill=tk.X, padx=(2, 0), pady=(0, 2))
-        
-        # Main card frame
-        card_frame = tk.Frame(container, bg=bg_color, relief=tk.FLAT, bd=0)
-        card_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Content area with padding
-        content_frame = tk.Frame(card_frame, bg=bg_color)
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=padding, pady=padding)
-        
-        return content_frame
+        return tk.Frame(parent,
+                        bg=bg_color,
+                        relief=tk.FLAT,
+                        bd=0,
+                        padx=padding,
+                        pady=padding,
+                        highlightthickness=2 if shadow else 0,
+                        highlightbackground=ModernStyle.SHADOW_LIGHT,
+                        highlightcolor=ModernStyle.SHADOW_LIGHT)
     
-    @staticmethod
     @staticmethod
     def create_category_card(parent, title, icon, color, count=None, command=None):
-        """Create a colorful category card like in the reference UI."""
-        # Card container with enhanced shadow effect
-        card_container = tk.Frame(parent, bg=ModernStyle.BG_GRADIENT_START)
-        card_container.pack(side=tk.LEFT, padx=(0, ModernStyle.ITEM_SPACING))
-        
-        # Enhanced shadow with multiple layers for depth
-        shadow_bottom = tk.Frame(card_container, bg=ModernStyle.SHADOW_MEDIUM, height=3)
-        shadow_bottom.pack(fill=tk.X, padx=3, pady=(3, 0))
-        
-        shadow_mid = tk.Frame(card_container, bg=ModernStyle.SHADOW_LIGHT, height=2)
-        shadow_mid.pack(fill=tk.X, padx=2, pady=(0, 0))
-        
-        # Main card with enhanced styling
-        card = tk.Button(card_container,
-                        bg=color,
-                        relief=tk.FLAT,
-                        bd=0,
-                        highlightthickness=0,
-                        cursor="hand2" if command else "arrow",
-                        command=command)
-        card.pack()
-        
-        # Card content with better spacing
-        card_content = tk.Frame(card, bg=color)
-        card_content.pack(padx=25, pady=25)
-        
-        # Icon with enhanced styling
-        icon_label = tk.Label(card_content,
-                             text=icon,
-                             font=("Segoe UI", 28, "normal"),
-                             fg=ModernStyle.TEXT_WHITE,
-                             bg=color)
-        icon_label.pack(pady=(0, 8))
-        
-        # Title with modern font
-        title_label = tk.Label(card_content,
-                              text=title,
-                              font=ModernStyle.BUTTON_FONT,
-                              fg=ModernStyle.TEXT_WHITE,
-                              bg=color)
-        title_label.pack(pady=(8, 0))
+        """Create a colorful category card like in the reference UI.
+
+        The card is a single Canvas whose shadow strips, body and texts are canvas
+        items, laid out as the former stack of frames, button and labels was.
+        """
+        icon_font = _shared_font(("Segoe UI", 28, "normal"))
+        title_font = _shared_font(ModernStyle.BUTTON_FONT)
+        count_font = _shared_font(ModernStyle.SMALL_FONT)
+        count_text = f"{count} files" if count is not None else None
+        text_color = ModernStyle.TEXT_WHITE
         
-        # Count if provided
-        if count is not None:
-            count_label = tk.Label(card_content,
-                                  text=f"{count} files",
-                                  font=ModernStyle.SMALL_FONT,
-                                  fg="#e2e8f0",  # Light gray instead of alpha
-                                  bg=color)
-            count_label.pack()
+        # Content size, then the 25px padding the card body had around it
+        icon_h = icon_font.metrics("linespace")
+        title_h = title_font.metrics("linespace")
+        content_w = max(icon_font.measure(icon), title_font.measure(title))
+        content_h = icon_h + 8 + 8 + title_h
+        if count_text is not None:
+            content_w = max(content_w, count_font.measure(count_text))
+            content_h += count_font.metrics("linespace")
+        width = content_w + 50
+        shadow_h = 8  # 3px gap, 3px and 2px shadow strips above the body
+        height = shadow_h + content_h + 50
+        
+        card = tk.Canvas(parent,
+                         width=width,
+                         height=height,
+                         bg=ModernStyle.BG_GRADIENT_START,
+                         highlightthickness=0,
+                         bd=0,
+                         cursor="hand2" if command else "arrow")
+        card.pack(side=tk.LEFT, padx=(0, ModernStyle.ITEM_SPACING))
         
-        return card_container
+        # Enhanced shadow with multiple layers for depth
+        card.create_rectangle(3, 3, width - 3, 6, fill=ModernStyle.SHADOW_MEDIUM, width=0)
+        card.create_rectangle(2, 6, width - 2, shadow_h, fill=ModernStyle.SHADOW_LIGHT, width=0)
+        
+        # Main card body with icon, title and optional count
+        card.create_rectangle(0, shadow_h, width, height, fill=color, width=0)
+        center = width / 2
+        y = shadow_h + 25
+        card.create_text(center, y, text=icon, font=icon_font, fill=text_color, anchor=tk.N)
+        y += icon_h + 16
+        card.create_text(center, y, text=title, font=title_font, fill=text_color, anchor=tk.N)
+        if count_text is not None:
+            y += title_h
+            card.create_text(center, y, text=count_text, font=count_font,
+                             fill="#e2e8f0",  # Light gray instead of alpha
+                             anchor=tk.N, tags="count")
+        
+        if command:
+            card.bind("<Button-1>", lambda event: command())
+        
+        return card
 
 class ModernSidebar:
     """Modern sidebar navigation inspired by the reference UI."""
@@ -216,6 +274,8 @@ class ModernSidebar:
     def __init__(self, parent, width=250):
         self.parent = parent
         self.width = width
+        # (icon, text) -> widgets of an existing nav item, reused if it is created again
+        self._nav_items: Dict[tuple, tuple] = {}
         self.setup_sidebar()
         
     def setup_sidebar(self):
@@ -231,25 +291,32 @@ class ModernSidebar:
         self.sidebar.grid_rowconfigure(1, weight=1)  # Navigation area expands
         self.sidebar.grid_columnconfigure(0, weight=1)
         
-        # User section at top
-        self.setup_user_section()
-        
         # Navigation items
         self.setup_navigation()
         
-        # Bottom section
+        # The user section (top) and bottom section are built when the sidebar is first
+        # shown, so creating a sidebar that is not on screen yet stays cheap
+        self._deferred_build = self.sidebar.bind('<Map>', self._build_deferred_sections, add='+')
+        
+    def _build_deferred_sections(self, event=None):
+        """Build the user and bottom sections on the sidebar's first appearance."""
+        if self._deferred_build is None:
+            return
+        self.sidebar.unbind('<Map>', self._deferred_build)
+        self._deferred_build = None
+        self.setup_user_section()
         self.setup_bottom_section()
         
     def setup_user_section(self):
         """Setup the user profile section."""
         user_frame = tk.Frame(self.sidebar, bg=ModernStyle.BG_SIDEBAR)
         user_frame.grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 30))
+        user_frame.grid_columnconfigure(0, weight=1)  # Keeps the avatar centered
         
-        # User avatar (circle)
+        # User avatar (circle); fixed size, its label is placed rather than gridded
         avatar_frame = tk.Frame(user_frame, bg=ModernStyle.BG_CARD, 
                                width=50, height=50)
-        avatar_frame.pack()
-        avatar_frame.pack_propagate(False)
+        avatar_frame.grid(row=0, column=0)
         
         # User initial
         user_label = tk.Label(avatar_frame, text="👤", 
@@ -274,28 +341,40 @@ class ModernSidebar:
             self.create_nav_item(nav_frame, icon, text, active, i)
             
     def create_nav_item(self, parent, icon, text, active=False, row=0):
-        """Create a navigation item."""
+        """Create a navigation item, or re-show and recolor it if it already exists."""
         bg_color = ModernStyle.ACCENT_CYAN if active else ModernStyle.BG_SIDEBAR
         text_color = ModernStyle.TEXT_WHITE
         
+        pooled = self._nav_items.get((icon, text))
+        if pooled is not None:
+            item_frame = pooled[0]
+            item_frame.grid(row=row, column=0, sticky="ew", pady=2)
+            for widget in pooled:
+                widget.configure(bg=bg_color)
+            return item_frame
+        
         item_frame = tk.Frame(parent, bg=bg_color, cursor="hand2")
         item_frame.grid(row=row, column=0, sticky="ew", pady=2)
+        item_frame.grid_columnconfigure(0, weight=1)
         
         # Content frame
         content = tk.Frame(item_frame, bg=bg_color)
-        content.pack(fill=tk.X, padx=15, pady=12)
+        content.grid(row=0, column=0, sticky="ew", padx=15, pady=12)
         
         # Icon
         icon_label = tk.Label(content, text=icon, 
                              font=("Segoe UI", 14),
                              bg=bg_color, fg=text_color)
-        icon_label.pack(side=tk.LEFT)
+        icon_label.grid(row=0, column=0)
         
         # Text
         text_label = tk.Label(content, text=text,
                              font=ModernStyle.BODY_FONT,
                              bg=bg_color, fg=text_color)
-        text_label.pack(side=tk.LEFT, padx=(15, 0))
+        text_label.grid(row=0, column=1, padx=(15, 0))
+        
+        self._nav_items[(icon, text)] = (item_frame, content, icon_label, text_label)
+        return item_frame
         
     def setup_bottom_section(self):
         """Setup bottom section with settings."""
@@ -306,171 +385,49 @@ class ModernSidebar:
         self.create_nav_item(bottom_frame, "⚙️", "Settings", False, 0)
         # Sign out
         self.create_nav_item(bottom_frame, "🚪", "Sign Out", False, 1)
-    
-    @staticmethod
-    def configure_style():
-        """Configure modern UI styles with enhanced visual effects."""
-        style = ttk.Style()
-        
-        # Use a modern theme as base
-        style.theme_use('clam')
-        
-        # Configure default font for all tkinter widgets
-        import tkinter as tk
-        tk.font.nametofont("TkDefaultFont").configure(family="Segoe UI", size=11)
-        tk.font.nametofont("TkTextFont").configure(family="Segoe UI", size=11)
-        tk.font.nametofont("TkFixedFont").configure(family="Consolas", size=11)
-        tk.font.nametofont("TkMenuFont").configure(family="Segoe UI", size=10)
-        tk.font.nametofont("TkHeadingFont").configure(family="Segoe UI", size=14, weight="bold")
-        tk.font.nametofont("TkCaptionFont").configure(family="Segoe UI", size=9)
-        tk.font.nametofont("TkSmallCaptionFont").configure(family="Segoe UI", size=8)
-        tk.font.nametofont("TkIconFont").configure(family="Segoe UI", size=11)
-        tk.font.nametofont("TkTooltipFont").configure(family="Segoe UI", size=10)
-        
-        # Configure default ttk styles with modern fonts
-        style.configure(".", font=ModernStyle.BODY_FONT)
-        style.configure("TLabel", font=ModernStyle.BODY_FONT, background=ModernStyle.BG_CARD)
-        style.configure("TFrame", background=ModernStyle.BG_CARD)
-        style.configure("TEntry", font=ModernStyle.BODY_FONT, fieldbackground=ModernStyle.BG_CARD)
-        style.configure("TCombobox", font=ModernStyle.BODY_FONT)
-        style.configure("Treeview", font=ModernStyle.BODY_FONT, background=ModernStyle.BG_CARD)
-        style.configure("Treeview.Heading", font=ModernStyle.SUBHEADER_FONT)
-        
-        # Modern Primary Button (enhanced)
-        style.configure("ModernPrimary.TButton",
-                       background=ModernStyle.PRIMARY_BLUE,
-                       foreground=ModernStyle.TEXT_WHITE,
-                       font=ModernStyle.BUTTON_FONT,
-                       padding=(20, 12),
-                       relief="flat",
-                       borderwidth=0)
-        
-        style.map("ModernPrimary.TButton",
-                 background=[('active', '#1d4ed8'),
-                            ('pressed', '#1e40af')])
-        
-        # Modern Secondary Button
-        style.configure("ModernSecondary.TButton",
-                       background=ModernStyle.BG_CARD,
-                       foreground=ModernStyle.PRIMARY_BLUE,
-                       font=ModernStyle.BUTTON_FONT,
-                       padding=(20, 12),
-                       relief="solid",
-                       borderwidth=1)
-        
-        style.map("ModernSecondary.TButton",
-                 background=[('active', ModernStyle.BG_SECONDARY)],
-                 relief=[('pressed', 'flat')])
-        
-        # Modern Success Button
-        style.configure("ModernSuccess.TButton",
-                       background=ModernStyle.ACCENT_GREEN,
-                       foreground=ModernStyle.TEXT_WHITE,
-                       font=ModernStyle.BUTTON_FONT,
-                       padding=(20, 12),
-                       relief="flat",
-                       borderwidth=0)
-        
-        # Modern Purple Accent Button
-        style.configure("ModernAccent.TButton",
-                       background=ModernStyle.PRIMARY_PURPLE,
-                       foreground=ModernStyle.TEXT_WHITE,
-                       font=ModernStyle.BUTTON_FONT,
-                       padding=(20, 12),
-                       relief="flat",
-                       borderwidth=0)
-        
-        # Configure Modern Frame styles to fix visual boxes
-        style.configure("CopilotCard.TFrame",
-                       background=ModernStyle.BG_CARD,
-                       relief="flat",
-                       borderwidth=0)
-        
-        # Configure Card Frame (for main.py compatibility)
-        style.configure("Card.TFrame",
-                       background=ModernStyle.BG_CARD,
-                       relief="flat",
-                       borderwidth=0)
-        
-        # Configure Clean Frame (no borders at all)
-        style.configure("Clean.TFrame",
-                       background=ModernStyle.BG_CARD,
-                       relief="flat",
-                       borderwidth=0)
-        
-        # Configure Light Background Frame
-        style.configure("Light.TFrame",
-                       background=ModernStyle.BG_LIGHT,
-                       relief="flat",
-                       borderwidth=0)
-        
-        # Configure Header Frame
-        style.configure("CopilotHeader.TFrame",
-                       background=ModernStyle.PRIMARY_BLUE,
-                       relief="flat",
-                       borderwidth=0)
-        
-        # Configure Labels
-        style.configure("CopilotTitle.TLabel",
-                       font=ModernStyle.HEADER_FONT,
-                       foreground=ModernStyle.TEXT_WHITE,
-                       background=ModernStyle.PRIMARY_BLUE)
-        
-        style.configure("CopilotSubtitle.TLabel",
-                       font=ModernStyle.SUBHEADER_FONT,
-                       foreground=ModernStyle.TEXT_PRIMARY,
-                       background=ModernStyle.BG_CARD)
-        
-        style.configure("CopilotBody.TLabel",
-                       font=ModernStyle.BODY_FONT,
-                       foreground=ModernStyle.TEXT_SECONDARY,
-                       background=ModernStyle.BG_CARD)
-        
-        style.configure("CopilotMuted.TLabel",
-                       font=ModernStyle.SMALL_FONT,
-                       foreground=ModernStyle.TEXT_MUTED,
-                       background=ModernStyle.BG_CARD)
-        
-        # Configure Entry
-        style.configure("Copilot.TEntry",
-                       fieldbackground=ModernStyle.BG_CARD,
-                       borderwidth=2,
-                       relief="solid",
-                       insertcolor=ModernStyle.PRIMARY_BLUE)
-        
-        style.map("Copilot.TEntry",
-                 focuscolor=[('!focus', ModernStyle.BORDER_LIGHT),
-                            ('focus', ModernStyle.BORDER_FOCUS)])
-        
-        # Configure Combobox
-        style.configure("Copilot.TCombobox",
-                       fieldbackground=ModernStyle.BG_CARD,
-                       borderwidth=2,
-                       relief="solid")
-        
-        # Configure LabelFrame
-        style.configure("CopilotPanel.TLabelframe",
-                       background=ModernStyle.BG_CARD,
-                       borderwidth=2,
-                       relief="solid",
-                       lightcolor=ModernStyle.BORDER_LIGHT,
-                       darkcolor=ModernStyle.BORDER_LIGHT)
-        
-        style.configure("CopilotPanel.TLabelframe.Label",
-                       font=ModernStyle.SUBHEADER_FONT,
-                       foreground=ModernStyle.PRIMARY_BLUE,
-                       background=ModernStyle.BG_CARD)
 
 class TranslationTable:
     """Advanced table widget for managing translations."""
     
+    # Quiet period after the last search keystroke before the table is re-filtered
+    SEARCH_DELAY_MS = 150
+    # Shorter window that coalesces quick successive filter selections
+    FILTER_DELAY_MS = 50
+    SEARCH_PLACEHOLDER = "🔍 Search translations..."
+    # Rows created per step; a large load shows its first rows at once and builds
+    # the rest in idle time instead of blocking the window
+    ROW_BATCH_SIZE = 500
+    
     def __init__(self, parent, edit_callback: Callable[[str, str], None]):
         self.parent = parent
         self.edit_callback = edit_callback
         self.data = {}
         self.translations = {}
-        self.item_keys = {}  # Store mapping from item_id to key
         self.tree = None  # Initialize tree as None first
+        self.context_menu = None  # built once by setup_context_menu
+        self._all_keys: List[str] = []  # every loaded key in order, the unfiltered view
+        self._search_text: Dict[str, str] = {}  # key -> casefolded searchable fields
+        self._last_search = ('', None, [])  # (term, keys searched, matching keys)
+        self._data_version = 0  # bumped whenever the loaded keys or translated keys change
+        self._last_filter = (None, [])  # (filter settings and data version, filtered keys)
+        self._stats_text = None  # text last given to stats_label
+        self._edit_dialog = None  # TranslationEditDialog, built on first edit and reused
+        # Indexes for the filters, category cards and stats, kept up to date as data
+        # changes; the per-value key dicts are ordered sets in data order
+        self._keys_by_topic: Dict[str, Dict[str, None]] = {}
+        self._keys_by_component: Dict[str, Dict[str, None]] = {}
+        self._translated_keys = set()  # loaded keys with a non-empty translation
+        self._topic_values: List[str] = []  # sorted topics last given to the topic combobox
+        self._component_values: List[str] = []  # likewise for the component combobox
+        self._refresh_job = None  # pending after()/after_idle() id of a scheduled refresh
+        self._refresh_idle = False  # the scheduled refresh is the undelayed after_idle one
+        self._search_placeholder = False  # search entry shows the placeholder, not a term
+        self._unbuilt_keys: List[str] = []  # keys whose rows are still to be created
+        self._row_build_job = None  # pending after_idle() id while rows are being created
+        self._shown_keys = set()  # keys matched by the filters at the last refresh, while building
+        self._attached_keys = None  # rows set_children last attached, once all rows exist
+        self._category_cards = []  # card canvases, retexted in place when their counts change
+        self._category_counts = None
         
         # Initialize modern styling
         ModernStyle.configure_style()
@@ -517,7 +474,9 @@ class TranslationTable:
         
     def setup_modern_header(self):
         """Setup modern header with search and pro badge."""
-        header_frame = tk.Frame(self.content_area, bg=ModernStyle.BG_GRADIENT_START, height=80)
+        header_bg = ModernStyle.BG_GRADIENT_START
+        badge_bg = ModernStyle.PRIMARY_BLUE
+        header_frame = tk.Frame(self.content_area, bg=header_bg, height=80)
         header_frame.grid(row=0, column=0, sticky="ew", padx=30, pady=20)
         header_frame.grid_propagate(False)
         header_frame.grid_columnconfigure(1, weight=1)
@@ -527,22 +486,22 @@ class TranslationTable:
                               text="Translation Manager",
                               font=ModernStyle.HEADER_FONT,
                               fg=ModernStyle.TEXT_PRIMARY,
-                              bg=ModernStyle.BG_GRADIENT_START)
+                              bg=header_bg)
         title_label.grid(row=0, column=0, sticky="w")
         
         # Search bar (center)
         self.setup_header_search(header_frame)
         
         # Pro badge (right)
-        pro_frame = tk.Frame(header_frame, bg=ModernStyle.PRIMARY_BLUE)
+        pro_frame = tk.Frame(header_frame, bg=badge_bg)
         pro_frame.grid(row=0, column=2, sticky="e")
         
         pro_label = tk.Label(pro_frame,
                             text="Pro",
                             font=ModernStyle.BUTTON_FONT,
                             fg=ModernStyle.TEXT_WHITE,
-                            bg=ModernStyle.PRIMARY_BLUE)
-        pro_label.pack(padx=20, pady=10)
+                            bg=badge_bg)
+        pro_label.grid(row=0, column=0, padx=20, pady=10)
         
     def setup_header_search(self, parent):
         """Setup the header search bar."""
@@ -561,17 +520,21 @@ class TranslationTable:
                                relief=tk.FLAT,
                                bd=0)
         search_entry.grid(row=0, column=0, sticky="ew", padx=20, pady=12)
-        search_entry.insert(0, "🔍 Search translations...")
+        self._search_placeholder = True
+        search_entry.insert(0, self.SEARCH_PLACEHOLDER)
         
-        # Search styling
+        # Search styling; the flag is set while the placeholder is in the entry so
+        # its insertion and removal don't trigger a search
         def on_focus_in(event):
-            if search_entry.get() == "🔍 Search translations...":
+            if self._search_placeholder:
                 search_entry.delete(0, tk.END)
+                self._search_placeholder = False
                 search_entry.config(fg=ModernStyle.TEXT_PRIMARY)
                 
         def on_focus_out(event):
             if not search_entry.get():
-                search_entry.insert(0, "🔍 Search translations...")
+                self._search_placeholder = True
+                search_entry.insert(0, self.SEARCH_PLACEHOLDER)
                 search_entry.config(fg=ModernStyle.TEXT_SECONDARY)
                 
         search_entry.bind("<FocusIn>", on_focus_in)
@@ -579,38 +542,84 @@ class TranslationTable:
         
     def setup_category_section(self):
         """Setup category cards section like the reference UI."""
-        categories_frame = tk.Frame(self.content_area, bg=ModernStyle.BG_GRADIENT_START)
+        section_bg = ModernStyle.BG_GRADIENT_START
+        categories_frame = tk.Frame(self.content_area, bg=section_bg)
         categories_frame.grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 20))
         
         # Section title
-        title_frame = tk.Frame(categories_frame, bg=ModernStyle.BG_GRADIENT_START)
+        title_frame = tk.Frame(categories_frame, bg=section_bg)
         title_frame.pack(fill=tk.X, pady=(0, 20))
         
         categories_title = tk.Label(title_frame,
                                    text="Categories",
                                    font=ModernStyle.SUBHEADER_FONT,
                                    fg=ModernStyle.TEXT_PRIMARY,
-                                   bg=ModernStyle.BG_GRADIENT_START)
+                                   bg=section_bg)
         categories_title.pack(side=tk.LEFT)
         
         # Category cards container
-        cards_frame = tk.Frame(categories_frame, bg=ModernStyle.BG_GRADIENT_START)
+        cards_frame = tk.Frame(categories_frame, bg=section_bg)
         cards_frame.pack(fill=tk.X)
+        self._cards_frame = cards_frame
         
         # Create category cards with colors like reference UI
         self.create_category_cards(cards_frame)
         
     def create_category_cards(self, parent):
-        """Create colorful category cards."""
+        """Create colorful category cards, or update the counts of the existing ones."""
+        counts = (self.get_translation_count(), self.get_topic_count(),
+                  self.get_component_count(), self.get_completed_count())
+        if counts == self._category_counts:
+            return
+        previous_counts, self._category_counts = self._category_counts, counts
+        
+        if self._category_cards and self._update_category_counts(previous_counts, counts):
+            return
+        
         categories = [
-            ("📝", "Translations", ModernStyle.CATEGORY_PURPLE, self.get_translation_count()),
-            ("📁", "Topics", ModernStyle.CATEGORY_TEAL, self.get_topic_count()),
-            ("🎯", "Components", ModernStyle.CATEGORY_PINK, self.get_component_count()),
-            ("✅", "Completed", ModernStyle.CATEGORY_BLUE, self.get_completed_count())
+            ("📝", "Translations", ModernStyle.CATEGORY_PURPLE),
+            ("📁", "Topics", ModernStyle.CATEGORY_TEAL),
+            ("🎯", "Components", ModernStyle.CATEGORY_PINK),
+            ("✅", "Completed", ModernStyle.CATEGORY_BLUE)
         ]
         
-        for icon, title, color, count in categories:
+        for card in self._category_cards:
+            card.destroy()
+        self._category_cards = [
             ModernCard.create_category_card(parent, title, icon, color, count)
+            for (icon, title, color), count in zip(categories, counts)
+        ]
+        
+    def _update_category_counts(self, previous_counts, counts):
+        """Retext the count item of each changed card in place.
+        
+        Returns False, leaving the cards untouched, if a new count no longer fits
+        its card; the cards then have to be recreated at their new size.
+        """
+        count_font = _shared_font(ModernStyle.SMALL_FONT)
+        changed = [(card, f"{count} files")
+                   for card, old, count in zip(self._category_cards, previous_counts, counts)
+                   if count != old]
+        for card, text in changed:
+            if count_font.measure(text) > int(card["width"]) - 50:
+                return False
+        for card, text in changed:
+            card.itemconfigure("count", text=text)
+        return True
+            
+    def _set_translation(self, key: str, translation: Optional[str]):
+        """Store a translation (None removes it), keeping the translated keys in step."""
+        if translation is None:
+            self.translations.pop(key, None)
+        else:
+            self.translations[key] = translation
+        if key in self.data and bool(translation) != (key in self._translated_keys):
+            if translation:
+                self._translated_keys.add(key)
+            else:
+                self._translated_keys.discard(key)
+            self._data_version += 1
+        self._update_row(key)
             
     def get_translation_count(self):
         """Get total translation count."""
@@ -618,53 +627,15 @@ class TranslationTable:
         
     def get_topic_count(self):
         """Get unique topic count."""
-        if not self.data:
-            return 0
-        topics = set(entry.get('topic', 'Unknown') for entry in self.data.values())
-        return len(topics)
+        return len(self._keys_by_topic)
         
     def get_component_count(self):
         """Get unique component count."""
-        if not self.data:
-            return 0
-        components = set(entry.get('ui_component', 'Unknown') for entry in self.data.values())
-        return len(components)
+        return len(self._keys_by_component)
         
     def get_completed_count(self):
         """Get completed translations count."""
-        if not self.data:
-            return 0
-        return len([k for k in self.data.keys() if self.translations.get(k, '')])
-        
-        # Header content
-        header_content = tk.Frame(header_frame, bg=ModernStyle.PRIMARY_BLUE)
-        header_content.pack(fill=tk.BOTH, expand=True, padx=30, pady=20)
-        
-        # Title with icon
-        title_frame = tk.Frame(header_content, bg=ModernStyle.PRIMARY_BLUE)
-        title_frame.pack(side=tk.LEFT)
-        
-        title_label = tk.Label(title_frame, 
-                              text="🤖 Translation Manager", 
-                              font=ModernStyle.HEADER_FONT,
-                              fg=ModernStyle.TEXT_WHITE,
-                              bg=ModernStyle.PRIMARY_BLUE)
-        title_label.pack(side=tk.LEFT)
-        
-        subtitle_label = tk.Label(title_frame,
-                                 text="Copilot Studio Localization Tool",
-                                 font=ModernStyle.BODY_FONT,
-                                 fg="#b3d7ff",  # Light blue
-                                 bg=ModernStyle.PRIMARY_BLUE)
-        subtitle_label.pack(side=tk.LEFT, padx=(15, 0))
-        
-        # Status indicator
-        self.header_status = tk.Label(header_content,
-                                     text="Ready",
-                                     font=ModernStyle.BODY_FONT,
-                                     fg=ModernStyle.TEXT_WHITE,
-                                     bg=ModernStyle.PRIMARY_BLUE)
-        self.header_status.pack(side=tk.RIGHT)
+        return len(self._translated_keys)
         
     def setup_control_panels(self):
         """Setup modern control panels with card design."""
@@ -727,31 +698,23 @@ class TranslationTable:
         filter_label.grid(row=0, column=0, sticky="w", pady=(0, 5))
         
         # Filter dropdown
-        if filter_type == "topic":
-            self.topic_filter = ttk.Combobox(filter_frame, 
-                                           state="readonly", 
-                                           font=ModernStyle.BODY_FONT,
-                                           style="Modern.TCombobox")
-            self.topic_filter.bind('<<ComboboxSelected>>', self.on_filter_change)
-            self.topic_filter.grid(row=1, column=0, sticky="ew")
-            
-        elif filter_type == "component":
-            self.component_filter = ttk.Combobox(filter_frame, 
-                                               state="readonly", 
-                                               font=ModernStyle.BODY_FONT,
-                                               style="Modern.TCombobox")
-            self.component_filter.bind('<<ComboboxSelected>>', self.on_filter_change)
-            self.component_filter.grid(row=1, column=0, sticky="ew")
-            
-        elif filter_type == "status":
-            self.status_filter = ttk.Combobox(filter_frame, 
-                                            state="readonly", 
-                                            font=ModernStyle.BODY_FONT,
-                                            style="Modern.TCombobox")
-            self.status_filter['values'] = ['All Status', 'Pending', 'Translated']
-            self.status_filter.set('All Status')
-            self.status_filter.bind('<<ComboboxSelected>>', self.on_filter_change)
-            self.status_filter.grid(row=1, column=0, sticky="ew")
+        self._make_filter_combobox(filter_frame, filter_type, "Modern.TCombobox")
+        
+    def _make_filter_combobox(self, parent, filter_type, style):
+        """Create the topic, component or status filter dropdown in row 1 of parent.
+        
+        The dropdown is stored as self.<filter_type>_filter.
+        """
+        combobox = ttk.Combobox(parent,
+                                state="readonly",
+                                font=ModernStyle.BODY_FONT,
+                                style=style)
+        if filter_type == "status":
+            combobox['values'] = ['All Status', 'Pending', 'Translated']
+            combobox.set('All Status')
+        combobox.bind('<<ComboboxSelected>>', self.on_filter_change)
+        combobox.grid(row=1, column=0, sticky="ew")
+        setattr(self, f"{filter_type}_filter", combobox)
             
     def setup_content_section(self):
         """Setup the main content area with modern table."""
@@ -827,31 +790,25 @@ class TranslationTable:
         table_container.grid_columnconfigure(0, weight=1)
         
         # Modern Treeview
-        columns = ('original', 'translation', 'topic', 'component', 'status')
-        self.tree = ttk.Treeview(table_container, columns=columns, show='headings')
-        
-        # Configure modern column headers
-        headers = [
-            ('original', '📝 Original Text'),
-            ('translation', '🌐 Translation'),
-            ('topic', '📁 Topic'),
-            ('component', '🧩 Component'),
-            ('status', '📊 Status')
-        ]
+        self._build_tree(table_container)
         
-        for col, header in headers:
-            self.tree.heading(col, text=header, anchor=tk.W if col != 'status' else tk.CENTER)
-            
-        # Set responsive column widths
-        self.tree.column('original', width=350, minwidth=200, stretch=True)
-        self.tree.column('translation', width=350, minwidth=200, stretch=True)
-        self.tree.column('topic', width=180, minwidth=100, stretch=True)
-        self.tree.column('component', width=120, minwidth=80, stretch=True)
-        self.tree.column('status', width=100, minwidth=80, stretch=False)
+    def _build_tree(self, parent, widths=None):
+        """Create self.tree with its scrollbars in parent, for either table layout.
+        
+        widths optionally overrides the _TABLE_COLUMNS widths, one per column.
+        """
+        columns = tuple(spec[0] for spec in _TABLE_COLUMNS)
+        self.tree = ttk.Treeview(parent, columns=columns, show='headings')
+        
+        # Configure modern column headers and responsive column widths in one pass
+        for index, (col, header, anchor, width, minwidth, stretch) in enumerate(_TABLE_COLUMNS):
+            self.tree.heading(col, text=header, anchor=anchor)
+            self.tree.column(col, width=widths[index] if widths else width,
+                             minwidth=minwidth, stretch=stretch)
         
         # Modern scrollbars
-        v_scrollbar = ttk.Scrollbar(table_container, orient=tk.VERTICAL, command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(table_container, orient=tk.HORIZONTAL, command=self.tree.xview)
+        v_scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.tree.yview)
+        h_scrollbar = ttk.Scrollbar(parent, orient=tk.HORIZONTAL, command=self.tree.xview)
         self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
         
         # Grid positioning
@@ -860,15 +817,8 @@ class TranslationTable:
         h_scrollbar.grid(row=1, column=0, sticky="ew")
         
         # Configure row styling
-        self.tree.tag_configure('translated', 
-                               background=ModernStyle.STATUS_SUCCESS, 
-                               foreground=ModernStyle.ACCENT_GREEN)
-        self.tree.tag_configure('pending', 
-                               background=ModernStyle.STATUS_WARNING, 
-                               foreground=ModernStyle.ACCENT_ORANGE)
-        self.tree.tag_configure('selected', 
-                               background=ModernStyle.STATUS_INFO, 
-                               foreground=ModernStyle.PRIMARY_BLUE)
+        for tag, options in _ROW_TAGS:
+            self.tree.tag_configure(tag, **options)
         
         # Bind events
         self.tree.bind('<Double-1>', self.on_double_click)
@@ -976,31 +926,7 @@ class TranslationTable:
         header_label.grid(row=0, column=0, sticky="w", pady=(0, 8))
         
         # Filter dropdown
-        if filter_type == "topic":
-            self.topic_filter = ttk.Combobox(card_content, 
-                                           state="readonly", 
-                                           style="Copilot.TCombobox",
-                                           font=ModernStyle.BODY_FONT)
-            self.topic_filter.bind('<<ComboboxSelected>>', self.on_filter_change)
-            self.topic_filter.grid(row=1, column=0, sticky="ew")
-            
-        elif filter_type == "component":
-            self.component_filter = ttk.Combobox(card_content, 
-                                               state="readonly", 
-                                               style="Copilot.TCombobox",
-                                               font=ModernStyle.BODY_FONT)
-            self.component_filter.bind('<<ComboboxSelected>>', self.on_filter_change)
-            self.component_filter.grid(row=1, column=0, sticky="ew")
-            
-        elif filter_type == "status":
-            self.status_filter = ttk.Combobox(card_content, 
-                                            state="readonly", 
-                                            style="Copilot.TCombobox",
-                                            font=ModernStyle.BODY_FONT)
-            self.status_filter['values'] = ['All Status', 'Pending', 'Translated']
-            self.status_filter.set('All Status')
-            self.status_filter.bind('<<ComboboxSelected>>', self.on_filter_change)
-            self.status_filter.grid(row=1, column=0, sticky="ew")
+        self._make_filter_combobox(card_content, filter_type, "Copilot.TCombobox")
         
     def setup_content_area(self):
         """Setup the main content area with modern table - responsive."""
@@ -1066,63 +992,13 @@ class TranslationTable:
         table_frame.grid_rowconfigure(0, weight=1)
         table_frame.grid_columnconfigure(0, weight=1)
         
-        # Modern Treeview with responsive columns
-        columns = ('original', 'translation', 'topic', 'component', 'status')
-        self.tree = ttk.Treeview(table_frame, columns=columns, show='headings')
-        
-        # Configure modern column headers
-        self.tree.heading('original', text='📝 Original Text', anchor=tk.W)
-        self.tree.heading('translation', text='🌐 Translation', anchor=tk.W)
-        self.tree.heading('topic', text='📁 Topic', anchor=tk.W)
-        self.tree.heading('component', text='🧩 Component', anchor=tk.W)
-        self.tree.heading('status', text='📊 Status', anchor=tk.CENTER)
-        
-        # Set responsive column widths
-        self.tree.column('original', width=400, minwidth=200, stretch=True)
-        self.tree.column('translation', width=400, minwidth=200, stretch=True)
-        self.tree.column('topic', width=200, minwidth=100, stretch=True)
-        self.tree.column('component', width=150, minwidth=80, stretch=True)
-        self.tree.column('status', width=120, minwidth=80, stretch=False)
-        
-        # Modern scrollbars with grid positioning
-        v_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        # Grid positioning for tree and scrollbars
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
-        h_scrollbar.grid(row=1, column=0, sticky="ew")
-        
-        # Grid layout
-        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
-        
-        table_frame.columnconfigure(0, weight=1)
-        table_frame.rowconfigure(0, weight=1)
-        
-        # Configure vibrant row styling
-        self.tree.tag_configure('translated', 
-                               background=ModernStyle.STATUS_SUCCESS, 
-                               foreground=ModernStyle.ACCENT_GREEN)
-        self.tree.tag_configure('pending', 
-                               background=ModernStyle.STATUS_WARNING, 
-                               foreground=ModernStyle.ACCENT_ORANGE)
-        self.tree.tag_configure('selected', 
-                               background=ModernStyle.STATUS_INFO, 
-                               foreground=ModernStyle.PRIMARY_BLUE)
-        
-        # Bind events
-        self.tree.bind('<Double-1>', self.on_double_click)
-        self.tree.bind('<Button-3>', self.show_context_menu)
-        self.tree.bind('<Return>', self.on_double_click)
-        
-        # Modern context menu
-        self.setup_context_menu()
+        # Modern Treeview with responsive columns, wider in this layout
+        self._build_tree(table_frame, widths=(400, 400, 200, 150, 120))
         
     def setup_context_menu(self):
-        """Setup modern context menu."""
+        """Setup modern context menu; it is built once and shared by every table layout."""
+        if self.context_menu is not None:
+            return
         self.context_menu = tk.Menu(self.tree, tearoff=0, bg=ModernStyle.BG_CARD, 
                                    fg=ModernStyle.TEXT_PRIMARY, font=ModernStyle.BODY_FONT)
         
@@ -1185,28 +1061,99 @@ class TranslationTable:
         
     def load_data(self, data: Dict[str, Dict]):
         """Load localization data into the table."""
+        # Remove the previous rows, including those currently hidden by filters; rows
+        # use their key as the item id, so they are the old keys already built
+        if self._row_build_job is not None:
+            self.frame.after_cancel(self._row_build_job)
+            self._row_build_job = None
+        if self._unbuilt_keys:
+            unbuilt = set(self._unbuilt_keys)
+            self.tree.delete(*[key for key in self.data if key not in unbuilt])
+        else:
+            self.tree.delete(*self.data)
+        self._attached_keys = None
         self.data = data
+        self._all_keys = list(data)
         self.translations = {}
-        self.item_keys = {}  # Clear the key mapping
-        
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._keys_by_topic = {}
+        self._keys_by_component = {}
+        for key, entry in data.items():
+            self._keys_by_topic.setdefault(entry['topic'], {})[key] = None
+            self._keys_by_component.setdefault(entry['ui_component'], {})[key] = None
+        self._translated_keys = set()
+        # Casefold the searched fields once here rather than on every search keystroke
+        self._search_text = {key: self._entry_search_text(entry) for key, entry in data.items()}
+        self._last_search = ('', None, [])
+        self._data_version += 1
+        
+        # One row per entry (its key as the item id), created once; filtering only
+        # changes which rows are attached and edits update their row in place.
+        # The first batch is created now and the rest by _build_next_rows.
+        self._unbuilt_keys = list(self._all_keys)
+        self._insert_rows(self._take_unbuilt_keys())
             
-        # Populate all filters
-        topics = sorted(set(entry['topic'] for entry in data.values()))
-        self.topic_filter['values'] = ['All Topics'] + topics
+        # Populate all filters from the indexes; the value lists are only sent to the
+        # comboboxes when they differ from the previous load's
+        topics = sorted(self._keys_by_topic)
+        if topics != self._topic_values:
+            self._topic_values = topics
+            self.topic_filter['values'] = ['All Topics'] + topics
         self.topic_filter.set('All Topics')
         
-        components = sorted(set(entry['ui_component'] for entry in data.values()))
-        self.component_filter['values'] = ['All Components'] + components
+        components = sorted(self._keys_by_component)
+        if components != self._component_values:
+            self._component_values = components
+            self.component_filter['values'] = ['All Components'] + components
         self.component_filter.set('All Components')
         
-        # Update stats
-        self.update_stats()
-        
-        # Add data to tree
+        # Add data to tree; this also updates the stats
         self.refresh_display()
+        if self._unbuilt_keys:
+            self._row_build_job = self.frame.after_idle(self._build_next_rows)
+        
+    @staticmethod
+    def _entry_search_text(entry: Dict) -> str:
+        """Return the casefolded text a search is matched against for an entry.
+        
+        Entries from LocalizationParser carry their text, description and topic
+        already lowercased; those are reused instead of lowering them again. Only
+        non-ASCII text needs casefolding beyond lowercasing (e.g. 'ß' to 'ss').
+        """
+        lc_text = entry.get('_lc_text')
+        if lc_text is None:
+            text = '\n'.join((entry['text'], entry['topic'], entry['description'],
+                              entry['ui_component'])).lower()
+        else:
+            text = '\n'.join((lc_text, entry['_lc_topic'], entry['_lc_desc'],
+                              entry['ui_component'].lower()))
+        return text if text.isascii() else text.casefold()
+        
+    def _take_unbuilt_keys(self) -> List[str]:
+        """Remove and return the next batch of keys that have no row yet."""
+        batch = self._unbuilt_keys[:self.ROW_BATCH_SIZE]
+        del self._unbuilt_keys[:self.ROW_BATCH_SIZE]
+        return batch
+        
+    def _insert_rows(self, keys: List[str]):
+        """Create the rows for keys at the end of the table."""
+        for key in keys:
+            values, tags = self._row_display(key)
+            self.tree.insert('', tk.END, iid=key, values=values, tags=tags)
+            
+    def _build_next_rows(self):
+        """Create the next batch of rows, leaving attached only those the filters show.
+        
+        Rows are built in data order, which is also the order the filters keep, so
+        appending the new matching rows keeps the table in order.
+        """
+        self._row_build_job = None
+        batch = self._take_unbuilt_keys()
+        self._insert_rows(batch)
+        hidden = [key for key in batch if key not in self._shown_keys]
+        if hidden:
+            self.tree.detach(*hidden)
+        if self._unbuilt_keys:
+            self._row_build_job = self.frame.after_idle(self._build_next_rows)
         
     def refresh_display(self):
         """Refresh the table display based on current filters."""
@@ -1214,94 +1161,115 @@ class TranslationTable:
         if not self.tree:
             return
             
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        self.item_keys.clear()  # Clear the key mapping
-            
         # Apply filters
-        filtered_data = self.apply_filters()
-        
-        # Add items to tree
-        for key, entry in filtered_data.items():
-            translation = self.translations.get(key, '')
-            status = 'Translated' if translation else 'Pending'
-            
-            # Truncate long text for display
-            original_display = self.truncate_text(entry['text'], 100)
-            translation_display = self.truncate_text(translation, 100)
-            
-            item_id = self.tree.insert('', tk.END, values=(
-                original_display,
-                translation_display,
-                entry['topic'],
-                entry['ui_component'],
-                status
-            ))
-            
-            # Store the key for reference using item metadata
-            self.item_keys[item_id] = key
-            
-            # Color code based on status
-            if translation:
-                self.tree.item(item_id, tags=('translated',))
-            else:
-                self.tree.item(item_id, tags=('pending',))
+        filtered_keys = self.apply_filters()
+        
+        # Attach the matching rows in order and detach the rest, in a single call;
+        # rows still waiting to be built are attached as they are created
+        if self._unbuilt_keys:
+            self._shown_keys = set(filtered_keys)
+            unbuilt = set(self._unbuilt_keys)
+            self.tree.set_children('', *[key for key in filtered_keys if key not in unbuilt])
+            self._attached_keys = None
+        elif filtered_keys is not self._attached_keys and filtered_keys != self._attached_keys:
+            # Skipped when the rows shown are unchanged, sparing Tk the relink and redraw
+            self.tree.set_children('', *filtered_keys)
+            self._attached_keys = filtered_keys
         
         # Update stats
-        self.update_stats()
-        
-    def apply_filters(self) -> Dict[str, Dict]:
-        """Apply search, topic, component, and status filters to the data."""
-        filtered_data = self.data.copy()
+        self.update_stats(len(filtered_keys))
+        
+    def _row_display(self, key: str):
+        """Return the row values and status tag shown for a key."""
+        entry = self.data[key]
+        translation = self.translations.get(key, '')
+        
+        # Truncate long text for display
+        values = (
+            self.truncate_text(entry['text'], 100),
+            self.truncate_text(translation, 100),
+            entry['topic'],
+            entry['ui_component'],
+            'Translated' if translation else 'Pending'
+        )
+        # Color code based on status
+        tags = ('translated',) if translation else ('pending',)
+        return values, tags
+        
+    def _update_row(self, key: str):
+        """Redraw a key's row after its translation changed."""
+        if key in self.data and key not in self._unbuilt_keys:
+            values, tags = self._row_display(key)
+            self.tree.item(key, values=values, tags=tags)
+        
+    def apply_filters(self) -> List[str]:
+        """Apply search, topic, component, and status filters, returning the keys shown.
+        
+        The topic and component indexes narrow the keys first, so the status and
+        search checks only run over the keys those filters leave. With no filter set
+        the shared list of all keys is returned as is, and the result is reused until
+        the filters or data change; callers must not modify it.
+        """
+        topic_filter = self.topic_filter.get()
+        component_filter = self.component_filter.get()
+        status_filter = self.status_filter.get()
+        search_term = '' if self._search_placeholder else self.search_var.get().casefold()
+        filter_key = (search_term, topic_filter, component_filter, status_filter, self._data_version)
+        if filter_key == self._last_filter[0]:
+            return self._last_filter[1]
+        filtered_keys = self._filter_keys(topic_filter, component_filter, status_filter, search_term)
+        self._last_filter = (filter_key, filtered_keys)
+        return filtered_keys
+        
+    def _filter_keys(self, topic_filter: str, component_filter: str, status_filter: str,
+                     search_term: str) -> List[str]:
+        """Return the keys passing the given filter settings, in data order."""
+        keys = self.data
         
-        # Apply search filter
-        search_term = self.search_var.get().lower()
-        if search_term:
-            filtered_data = {
-                key: entry for key, entry in filtered_data.items()
-                if (search_term in entry['text'].lower() or
-                    search_term in entry['topic'].lower() or
-                    search_term in entry['description'].lower() or
-                    search_term in entry['ui_component'].lower())
-            }
-            
         # Apply topic filter
-        topic_filter = self.topic_filter.get()
         if topic_filter and topic_filter != 'All Topics':
-            filtered_data = {
-                key: entry for key, entry in filtered_data.items()
-                if entry['topic'] == topic_filter
-            }
+            keys = self._keys_by_topic.get(topic_filter, {})
         
         # Apply component filter
-        component_filter = self.component_filter.get()
         if component_filter and component_filter != 'All Components':
-            filtered_data = {
-                key: entry for key, entry in filtered_data.items()
-                if entry['ui_component'] == component_filter
-            }
+            component_keys = self._keys_by_component.get(component_filter, {})
+            if keys is self.data:
+                keys = component_keys
+            else:
+                # Walk the smaller index; both are in data order
+                smaller, larger = sorted((keys, component_keys), key=len)
+                keys = [key for key in smaller if key in larger]
         
         # Apply status filter
-        status_filter = self.status_filter.get()
-        if status_filter and status_filter != 'All Status':
-            if status_filter == 'Translated':
-                filtered_data = {
-                    key: entry for key, entry in filtered_data.items()
-                    if self.translations.get(key, '')
-                }
-            elif status_filter == 'Pending':
-                filtered_data = {
-                    key: entry for key, entry in filtered_data.items()
-                    if not self.translations.get(key, '')
-                }
+        translated_keys = self._translated_keys
+        if status_filter == 'Translated':
+            keys = [key for key in keys if key in translated_keys]
+        elif status_filter == 'Pending':
+            keys = [key for key in keys if key not in translated_keys]
+            
+        # Apply search filter
+        if search_term:
+            # A term containing the previous one can only match among its matches, so
+            # while typing on, only those are searched if the other filters are unchanged
+            last_term, last_keys, last_matches = self._last_search
+            candidates = keys
+            if last_term and last_term in search_term and (
+                    last_keys is keys or (isinstance(keys, list) and last_keys == keys)):
+                candidates = last_matches
+            search_text = self._search_text
+            matches = [key for key in candidates if search_term in search_text[key]]
+            self._last_search = (search_term, keys, matches)
+            keys = matches
             
-        return filtered_data
+        if keys is self.data:
+            return self._all_keys
+        return list(keys)
     
     def select_all_items(self):
         """Select all visible items in the tree."""
-        for item in self.tree.get_children():
-            self.tree.selection_add(item)
+        self.tree.selection_set(self.tree.get_children())
+        
+    select_all = select_all_items
             
     def clear_search(self):
         """Clear the search field."""
@@ -1313,20 +1281,24 @@ class TranslationTable:
         self.topic_filter.set('All Topics')
         self.component_filter.set('All Components')
         self.status_filter.set('All Status')
-        self.refresh_display()
+        self._schedule_refresh()
         
-    def update_stats(self):
-        """Update the vibrant statistics display."""
+    def update_stats(self, filtered_count: Optional[int] = None):
+        """Update the vibrant statistics display.
+        
+        refresh_display passes the number of rows its filters matched, so the
+        filters aren't run a second time just to count them.
+        """
         if not self.data:
-            self.stats_label.config(text="🔍 Ready to load translation data...")
+            self._set_stats_text("🔍 Ready to load translation data...")
             return
             
         total_entries = len(self.data)
-        translated_count = len([k for k in self.data.keys() if self.translations.get(k, '')])
+        translated_count = len(self._translated_keys)
         pending_count = total_entries - translated_count
         
-        filtered_data = self.apply_filters()
-        filtered_count = len(filtered_data)
+        if filtered_count is None:
+            filtered_count = len(self.apply_filters())
         
         # Calculate completion percentage
         completion_pct = int((translated_count / total_entries * 100)) if total_entries > 0 else 0
@@ -1336,31 +1308,51 @@ class TranslationTable:
         else:
             stats_text = f"📊 {total_entries} entries total • ✅ {translated_count} translated ({completion_pct}%) • ⏳ {pending_count} pending"
             
-        self.stats_label.config(text=stats_text)
-        
-        # Update header status with completion info
-        if hasattr(self, 'header_status'):
-            if completion_pct == 100:
-                self.header_status.config(text="🎉 Complete!", fg="#90EE90")  # Light green
-            elif completion_pct > 50:
-                self.header_status.config(text=f"⚡ {completion_pct}% Done", fg="#87CEEB")  # Sky blue
-            else:
-                self.header_status.config(text=f"🚀 {completion_pct}% Done", fg="#FFB6C1")  # Light pink
+        self._set_stats_text(stats_text)
+        self.create_category_cards(self._cards_frame)
+        
+    def _set_stats_text(self, text: str):
+        """Show text in the stats footer, skipping the Tcl call when it is unchanged."""
+        if text != self._stats_text:
+            self._stats_text = text
+            self.stats_label.config(text=text)
         
     def truncate_text(self, text: str, max_length: int) -> str:
         """Truncate text for display."""
         if len(text) <= max_length:
             return text
-        return text[:max_length-3] + "..."
+        return _truncated(text, max_length)
         
     def on_search_change(self, *args):
-        """Handle search input changes."""
+        """Handle search input changes, refreshing once typing pauses."""
+        if self._search_placeholder:
+            return
+        self._schedule_refresh(self.SEARCH_DELAY_MS)
+        
+    def _schedule_refresh(self, delay_ms: int = 0):
+        """Refresh the table once no further change arrives within delay_ms.
+        
+        Without a delay the refresh runs when Tk is next idle, and every request
+        made before then shares that one refresh.
+        """
+        if self._refresh_job is not None:
+            if self._refresh_idle and not delay_ms:
+                return
+            self.frame.after_cancel(self._refresh_job)
+        self._refresh_idle = not delay_ms
+        if delay_ms:
+            self._refresh_job = self.frame.after(delay_ms, self._run_refresh)
+        else:
+            self._refresh_job = self.frame.after_idle(self._run_refresh)
+        
+    def _run_refresh(self):
+        """Refresh the table for the current search text and filters."""
+        self._refresh_job = None
         self.refresh_display()
         
     def on_filter_change(self, event):
-        """Handle filter changes."""
-        self.refresh_display()
-        self.update_stats()
+        """Handle filter changes; refresh_display also updates the stats."""
+        self._schedule_refresh(self.FILTER_DELAY_MS)
         
     def on_double_click(self, event):
         """Handle double-click to edit translation."""
@@ -1388,130 +1380,123 @@ class TranslationTable:
         original_text = self.data[key]['text']
         current_translation = self.translations.get(key, '')
         
-        # Show edit dialog
-        dialog = TranslationEditDialog(self.parent, original_text, current_translation, 
-                                     self.data[key]['description'])
-        new_translation = dialog.result
+        def on_close(new_translation: Optional[str]):
+            if new_translation is not None:
+                self._set_translation(key, new_translation)
+                self.edit_callback(key, new_translation)
+                self._schedule_refresh()
         
-        if new_translation is not None:
-            self.translations[key] = new_translation
-            self.edit_callback(key, new_translation)
-            self.refresh_display()
+        # Show edit dialog; it is built once and hidden, not destroyed, when closed
+        if self._edit_dialog is None:
+            self._edit_dialog = TranslationEditDialog(self.parent, original_text, current_translation,
+                                                      self.data[key]['description'], on_close)
+        else:
+            self._edit_dialog.reopen(original_text, current_translation,
+                                     self.data[key]['description'], on_close)
             
     def copy_original(self):
-        """Copy original text to clipboard."""
-        selection = self.tree.selection()
-        if not selection:
-            return
-            
-        item = selection[0]
-        key = self.get_key_from_item(item)
-        if key:
-            self.parent.clipboard_clear()
-            self.parent.clipboard_append(self.data[key]['text'])
+        """Copy the original text of the selected rows to clipboard, one per line."""
+        keys = self.get_selected_keys()
+        if keys:
+            self._copy_lines([self.data[key]['text'] for key in keys])
             
     def copy_translation(self):
-        """Copy translation to clipboard."""
-        selection = self.tree.selection()
-        if not selection:
-            return
+        """Copy the translations of the selected rows to clipboard, one per line."""
+        translations = self.translations
+        lines = [translations[key] for key in self.get_selected_keys() if key in translations]
+        if lines:
+            self._copy_lines(lines)
             
-        item = selection[0]
-        key = self.get_key_from_item(item)
-        if key and key in self.translations:
-            self.parent.clipboard_clear()
-            self.parent.clipboard_append(self.translations[key])
+    def _copy_lines(self, lines: List[str]):
+        """Replace the clipboard contents with lines, in a single clipboard write."""
+        self.parent.clipboard_clear()
+        self.parent.clipboard_append("\n".join(lines))
             
     def clear_selected(self):
-        """Clear the selected translation."""
-        selection = self.tree.selection()
-        if not selection:
+        """Clear the translations of the selected rows."""
+        keys = [key for key in self.get_selected_keys() if key in self.translations]
+        if not keys:
             return
             
-        item = selection[0]
-        key = self.get_key_from_item(item)
-        if key and key in self.translations:
-            del self.translations[key]
+        for key in keys:
+            self._set_translation(key, None)
             self.edit_callback(key, '')
-            self.refresh_display()
+        self._schedule_refresh()
             
     def get_key_from_item(self, item) -> Optional[str]:
-        """Get the localization key from a tree item."""
-        return self.item_keys.get(item)
+        """Get the localization key from a tree item (rows use their key as item id)."""
+        return item if item in self.data else None
         
     def update_translation(self, key: str, translation: str):
         """Update a translation programmatically."""
-        self.translations[key] = translation
-        self.refresh_display()
-        self.update_stats()
+        self._set_translation(key, translation)
+        # The row is redrawn in place; the stats and, with a status filter, the rows
+        # shown are refreshed once for a whole run of updates
+        self._schedule_refresh()
         
     def get_selected_keys(self) -> List[str]:
         """Get keys of selected items."""
-        selection = self.tree.selection()
-        keys = []
-        
-        for item in selection:
-            key = self.get_key_from_item(item)
-            if key:
-                keys.append(key)
-                
-        return keys
+        # Rows use their key as item id, so the selection is the keys themselves
+        data = self.data
+        return [item for item in self.tree.selection() if item in data]
         
-    def select_all(self):
-        """Select all items in the table."""
-        for item in self.tree.get_children():
-            self.tree.selection_add(item)
-            
     def clear_translations(self):
         """Clear all translations."""
+        # Only the rows that were showing a translation change
+        cleared_keys = list(self._translated_keys)
         self.translations.clear()
-        self.refresh_display()
+        self._translated_keys.clear()
+        self._data_version += 1
+        for key in cleared_keys:
+            self._update_row(key)
+        self._schedule_refresh()
 
 class TranslationEditDialog:
-    """Dialog for editing translations."""
+    """Dialog for editing translations.
+    
+    The window is built once; closing it only hides it, and reopen() refills it
+    for the next entry. The edited text, or None when cancelled, is passed to the
+    on_close callback.
+    """
     
-    def __init__(self, parent, original_text: str, current_translation: str, description: str):
+    def __init__(self, parent, original_text: str, current_translation: str, description: str,
+                 on_close: Optional[Callable[[Optional[str]], None]] = None):
+        self.parent = parent
         self.result = None
+        self.on_close = on_close
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Edit Translation")
         self.dialog.geometry("800x600")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
-        
-        # Center the dialog
-        self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
         
-        self.setup_ui(original_text, current_translation, description)
+        self.setup_ui()
+        self.reopen(original_text, current_translation, description, on_close)
         
-    def setup_ui(self, original_text: str, current_translation: str, description: str):
+    def setup_ui(self):
         """Setup the dialog UI."""
         main_frame = ttk.Frame(self.dialog, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Description
         ttk.Label(main_frame, text="Context:", font=('TkDefaultFont', 9, 'bold')).pack(anchor=tk.W)
-        desc_label = ttk.Label(main_frame, text=description, wraplength=750)
-        desc_label.pack(anchor=tk.W, pady=(0, 10))
+        self.desc_label = ttk.Label(main_frame, wraplength=750)
+        self.desc_label.pack(anchor=tk.W, pady=(0, 10))
         
         # Original text
         ttk.Label(main_frame, text="Original Text:", font=('TkDefaultFont', 9, 'bold')).pack(anchor=tk.W)
         orig_frame = ttk.Frame(main_frame)
         orig_frame.pack(fill=tk.X, pady=(0, 10))
         
-        orig_text = tk.Text(orig_frame, height=4, wrap=tk.WORD, state='disabled')
-        orig_scroll = ttk.Scrollbar(orig_frame, orient=tk.VERTICAL, command=orig_text.yview)
-        orig_text.configure(yscrollcommand=orig_scroll.set)
+        self.orig_text = tk.Text(orig_frame, height=4, wrap=tk.WORD, state='disabled')
+        orig_scroll = ttk.Scrollbar(orig_frame, orient=tk.VERTICAL, command=self.orig_text.yview)
+        self.orig_text.configure(yscrollcommand=orig_scroll.set)
         
-        orig_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.orig_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         orig_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Insert original text
-        orig_text.config(state='normal')
-        orig_text.insert('1.0', original_text)
-        orig_text.config(state='disabled')
-        
         # Translation text
         ttk.Label(main_frame, text="Translation:", font=('TkDefaultFont', 9, 'bold')).pack(anchor=tk.W)
         trans_frame = ttk.Frame(main_frame)
@@ -1524,13 +1509,6 @@ class TranslationEditDialog:
         self.trans_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         trans_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Insert current translation
-        if current_translation:
-            self.trans_text.insert('1.0', current_translation)
-            
-        # Focus on translation text
-        self.trans_text.focus_set()
-        
         # Buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(10, 0))
@@ -1541,15 +1519,48 @@ class TranslationEditDialog:
         # Bind Enter to save
         self.dialog.bind('<Control-Return>', lambda e: self.save())
         
+    def reopen(self, original_text: str, current_translation: str, description: str,
+               on_close: Optional[Callable[[Optional[str]], None]] = None):
+        """Fill the dialog with an entry and show it."""
+        self.result = None
+        self.on_close = on_close
+        self.desc_label.config(text=description)
+        
+        # Insert original text
+        self.orig_text.config(state='normal')
+        self.orig_text.delete('1.0', tk.END)
+        self.orig_text.insert('1.0', original_text)
+        self.orig_text.config(state='disabled')
+        
+        # Insert current translation
+        self.trans_text.delete('1.0', tk.END)
+        if current_translation:
+            self.trans_text.insert('1.0', current_translation)
+        
+        # Center the dialog
+        self.dialog.geometry("+%d+%d" % (self.parent.winfo_rootx() + 50, self.parent.winfo_rooty() + 50))
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        
+        # Focus on translation text
+        self.trans_text.focus_set()
+        
     def save(self):
         """Save the translation."""
-        self.result = self.trans_text.get('1.0', tk.END).strip()
-        self.dialog.destroy()
+        self._close(self.trans_text.get('1.0', tk.END).strip())
         
     def cancel(self):
         """Cancel the edit."""
-        self.result = None
-        self.dialog.destroy()
+        self._close(None)
+        
+    def _close(self, result: Optional[str]):
+        """Hide the dialog for reuse and report the result."""
+        self.result = result
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        on_close, self.on_close = self.on_close, None
+        if on_close:
+            on_close(result)
 
 class ProgressDialog:
     """Progress dialog for long-running operations."""